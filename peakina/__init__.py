@@ -2,7 +2,7 @@ import importlib.metadata as lib_meta
 
 from .cache import Cache, CacheEnum
 from .datapool import DataPool
-from .datasource import AVAILABLE_SCHEMES, DataSource, read_pandas
+from .datasource import AVAILABLE_SCHEMES, DataSource, read_arrow, read_pandas
 from .helpers import TypeEnum
 from .io import MatchEnum, fetch
 
@@ -17,5 +17,6 @@ __all__ = (
     "MatchEnum",
     "TypeEnum",
     "fetch",
+    "read_arrow",
     "read_pandas",
 )
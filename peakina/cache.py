@@ -1,32 +1,296 @@
+import json
+import logging
+import math
+import os
+import pickle
+import re
+import sqlite3
+import tempfile
 from abc import ABCMeta, abstractmethod
-from collections.abc import Callable
-from contextlib import suppress
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, replace
 from datetime import timedelta
 from enum import Enum
 from functools import lru_cache, wraps
+from hashlib import md5
 from pathlib import Path
+from threading import Lock, RLock
 from time import monotonic_ns, time
-from typing import Any, TypedDict
+from typing import Any, NamedTuple, TypedDict, TypeVar, cast
+from uuid import uuid4
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import feather
+
+logger = logging.getLogger(__name__)
+
+
+def _using_copy_on_write() -> bool:
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except pd.errors.OptionError:  # pandas >= 3, where copy-on-write is always used
+        return True
+
+
+def safe_copy(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Copy of a dataframe which can be modified without modifying the original one (and conversely):
+    with pandas copy-on-write mode, a shallow copy whose columns are only copied when written,
+    otherwise a deep copy.
+    """
+    return df.copy(deep=not _using_copy_on_write())
 
 
 class InMemoryCached(TypedDict):
-    value: pd.DataFrame
+    value: pd.DataFrame | pa.Buffer  # a buffer if the value is compressed
+    codec: "CompressionEnum | None"
     mtime: float
     created_at: float
+    size: int  # in bytes
+    cost: float | None  # time (in seconds) it took to load the value
+    priority: float  # used by the greedy dual eviction policy
 
 
 class CacheEnum(str, Enum):
     MEMORY = "memory"
     PICKLE = "pickle"
+    ARROW = "arrow"
+    TIERED = "tiered"
+    SHARED_MEMORY = "shared_memory"
+
+
+class EvictionPolicyEnum(str, Enum):
+    LRU = "lru"
+    GREEDY_DUAL = "greedy_dual"
+
+
+class ArrowFormatEnum(str, Enum):
+    FEATHER = "feather"
+    PARQUET = "parquet"
+
+
+class CompressionEnum(str, Enum):
+    LZ4 = "lz4"  # fast
+    ZSTD = "zstd"  # better ratio
+
+
+# first bytes of the frames written by each codec
+_CODEC_MAGICS = {
+    CompressionEnum.LZ4: b"\x04\x22\x4d\x18",
+    CompressionEnum.ZSTD: b"\x28\xb5\x2f\xfd",
+}
+
+
+class InvalidationReasonEnum(str, Enum):
+    MTIME = "mtime"  # a newer version of the value exists
+    EXPIRE = "expire"  # the value is too old
+
+
+class CacheEventEnum(str, Enum):
+    HIT = "hit"
+    MISS = "miss"
+    SET = "set"
+    DELETE = "delete"
+    INVALIDATION = "invalidation"
+    EVICTION = "eviction"
+
+
+class CacheEvent(NamedTuple):
+    kind: CacheEventEnum
+    key: str
+    # size of the value (set) or of the removed value (delete, invalidation, eviction)
+    nbytes: int = 0
+    # time (in seconds) it took to load the value, hence saved by a hit
+    cost: float = 0.0
+    reason: InvalidationReasonEnum | None = None
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    mtime_invalidations: int = 0
+    expire_invalidations: int = 0
+    evictions: int = 0
+    bytes_stored: int = 0
+    load_time_saved: float = 0.0  # in seconds
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def record(self, event: CacheEvent) -> None:
+        if event.kind is CacheEventEnum.HIT:
+            self.hits += 1
+            self.load_time_saved += event.cost
+        elif event.kind is CacheEventEnum.MISS:
+            self.misses += 1
+        elif event.kind is CacheEventEnum.INVALIDATION:
+            if event.reason is InvalidationReasonEnum.MTIME:
+                self.mtime_invalidations += 1
+            else:
+                self.expire_invalidations += 1
+        elif event.kind is CacheEventEnum.EVICTION:
+            self.evictions += 1
+
+
+CacheObserver = Callable[[CacheEvent], None]
+
+
+def _validate_compression(compression: CompressionEnum | None) -> CompressionEnum | None:
+    if compression is None:
+        return None
+    compression = CompressionEnum(compression)
+    if not pa.Codec.is_available(compression.value):  # pragma: no cover
+        raise ValueError(f"Compression {compression.value!r} is not available in pyarrow")
+    return compression
+
+
+def dump_compressed(value: pd.DataFrame, sink: str | pa.NativeFile, codec: CompressionEnum) -> None:
+    """pickle a dataframe in a file or a buffer, compressed with one of pyarrow's codecs"""
+    with pa.CompressedOutputStream(sink, codec.value) as stream:
+        pickle.dump(value, stream, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_compressed(source: pa.NativeFile, codec: CompressionEnum) -> pd.DataFrame:
+    with pa.CompressedInputStream(source, codec.value) as stream:
+        return pickle.load(stream)
+
+
+# number of keys without cached value (e.g. removed ones) whose stats are kept
+_MAX_UNSTORED_KEYS_STATS = 1024
+
+
+# schema metadata listing the object columns whose missing values are NaN (and not None)
+NAN_COLUMNS_METADATA_KEY = b"peakina_nan_columns"
+
+
+def dataframe_to_table(value: pd.DataFrame) -> pa.Table | None:
+    """
+    Arrow table of a dataframe to persist, or None if it can't be converted back exactly
+    (e.g. columns with mixed types).
+    Missing strings are read back as None by Arrow: the object columns whose missing values
+    are NaN are listed in the schema metadata to be restored by `table_to_dataframe`, and
+    dataframes with other kinds of missing strings (e.g. `pd.NA`) can't be converted.
+    """
+    try:
+        table = pa.Table.from_pandas(value)
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+
+    nan_columns = []
+    for column, dtype in value.dtypes.items():
+        if dtype.kind != "O" or not table.column(str(column)).null_count:
+            continue
+        null_value = value[column][value[column].isna()].iloc[0]
+        if isinstance(null_value, float) and math.isnan(null_value):
+            nan_columns.append(str(column))
+        elif null_value is not None:
+            return None
+    if nan_columns:
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), NAN_COLUMNS_METADATA_KEY: json.dumps(nan_columns)}
+        )
+    return table
+
+
+def table_to_dataframe(table: pa.Table) -> pd.DataFrame:
+    """dataframe of a table written by `dataframe_to_table`, possibly restricted to some columns"""
+    metadata = table.schema.metadata or {}
+    nan_columns = set(json.loads(metadata.get(NAN_COLUMNS_METADATA_KEY, "[]")))
+    df = table.to_pandas(split_blocks=True)
+    for column in df.columns:
+        if str(column) in nan_columns:
+            df[column] = df[column].where(df[column].notna(), np.nan)
+    return df
 
 
 class Cache(metaclass=ABCMeta):
+    """
+    Base class of all the caches.
+    Each cache keeps hits, misses, invalidations... counters, globally and per key,
+    which can be read with `stats` (the ones of the keys without cached value are only kept
+    for the last `_MAX_UNSTORED_KEYS_STATS` of them). Observers added with `add_observer` are called
+    with every `CacheEvent`.
+    """
+
+    def __init__(self) -> None:
+        self._stats = CacheStats()
+        self._keys_stats: dict[str, CacheStats] = {}
+        # keys whose stats are kept while they have no cached value, the least recent first
+        self._unstored_keys: OrderedDict[str, None] = OrderedDict()
+        self._stats_lock = Lock()
+        self._observers: list[CacheObserver] = []
+        # last mtime checked for each key and when it was checked
+        self._checked_mtimes: dict[str, tuple[float, float]] = {}
+
+    def add_observer(self, observer: CacheObserver) -> None:
+        self._observers.append(observer)
+
+    def stats(self, key: str | None = None) -> CacheStats:
+        """statistics of the cache (or of a given key)"""
+        with self._stats_lock:
+            if key is None:
+                return replace(self._stats)
+            return replace(self._keys_stats.get(key, CacheStats()))
+
+    def _notify(self, event: CacheEvent) -> None:
+        with self._stats_lock:
+            self._stats.record(event)
+            key_stats = self._keys_stats.setdefault(event.key, CacheStats())
+            key_stats.record(event)
+            # a set replaces the previous value of the key, other events keep or remove it
+            if event.kind is CacheEventEnum.SET:
+                bytes_stored = event.nbytes
+            elif event.kind in (CacheEventEnum.HIT, CacheEventEnum.MISS):
+                bytes_stored = key_stats.bytes_stored
+            else:
+                bytes_stored = 0
+            self._stats.bytes_stored += bytes_stored - key_stats.bytes_stored
+            key_stats.bytes_stored = bytes_stored
+            if bytes_stored:
+                self._unstored_keys.pop(event.key, None)
+            else:
+                self._unstored_keys[event.key] = None
+                self._unstored_keys.move_to_end(event.key)
+                if len(self._unstored_keys) > _MAX_UNSTORED_KEYS_STATS:
+                    del self._keys_stats[self._unstored_keys.popitem(last=False)[0]]
+            if event.kind in (CacheEventEnum.DELETE, CacheEventEnum.EVICTION):
+                self._checked_mtimes.pop(event.key, None)
+        for observer in self._observers:
+            try:
+                observer(event)
+            except Exception:
+                logger.exception(f"Cache observer {observer!r} failed")
+
+    def set_checked_mtime(self, key: str, mtime: float) -> None:
+        """record the mtime of the source of a key, which has just been checked"""
+        self._checked_mtimes[key] = (mtime, time())
+
+    def get_checked_mtime(self, key: str, max_age: timedelta) -> float:
+        """last checked mtime of the source of a key, if checked less than `max_age` ago"""
+        mtime, checked_at = self._checked_mtimes[key]
+        if time() > checked_at + max_age.total_seconds():
+            raise KeyError(key)
+        return mtime
+
     @staticmethod
     def get_cache(kind: CacheEnum, *args: Any, **kwargs: Any) -> "Cache":
         if kind == CacheEnum.PICKLE:
             return PickleCache(*args, **kwargs)
+        elif kind == CacheEnum.ARROW:
+            return ArrowCache(*args, **kwargs)
+        elif kind == CacheEnum.TIERED:
+            return TieredCache(*args, **kwargs)
+        elif kind == CacheEnum.SHARED_MEMORY:
+            return SharedMemoryCache(*args, **kwargs)
         else:
             return InMemoryCache(*args, **kwargs)
 
@@ -38,123 +302,872 @@ class Cache(metaclass=ABCMeta):
         expire: timedelta | None = None,
         cached_created_at: float,
     ) -> bool:
+        return (
+            Cache.invalidation_reason(
+                mtime=mtime,
+                cached_mtime=cached_mtime,
+                expire=expire,
+                cached_created_at=cached_created_at,
+            )
+            is not None
+        )
+
+    @staticmethod
+    def invalidation_reason(
+        *,
+        mtime: float | None = None,
+        cached_mtime: float,
+        expire: timedelta | None = None,
+        cached_created_at: float,
+    ) -> InvalidationReasonEnum | None:
         now = time()
-        is_newer_version = False
-        is_expired = False
-        if mtime is not None:
-            is_newer_version = mtime != cached_mtime
-        if expire is not None:
-            is_expired = now > cached_created_at + expire.total_seconds()
-        return is_newer_version or is_expired
+        if mtime is not None and mtime != cached_mtime:
+            return InvalidationReasonEnum.MTIME
+        if expire is not None and now > cached_created_at + expire.total_seconds():
+            return InvalidationReasonEnum.EXPIRE
+        return None
 
     @abstractmethod
     def get(
-        self, key: str, mtime: float | None = None, expire: timedelta | None = None
+        self,
+        key: str,
+        mtime: float | None = None,
+        expire: timedelta | None = None,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
-        """get a cached value"""
+        """get a cached value (optionally restricted to some `columns`)"""
 
     @abstractmethod
-    def set(self, key: str, value: pd.DataFrame, mtime: float | None = None) -> None:
-        """set a cached value"""
+    def set(
+        self,
+        key: str,
+        value: pd.DataFrame,
+        mtime: float | None = None,
+        cost: float | None = None,
+    ) -> None:
+        """set a cached value (`cost` is the time in seconds it took to load it)"""
 
     @abstractmethod
     def delete(self, key: str) -> None:
         """delete a cached value"""
 
+    @abstractmethod
+    def get_infos(self, key: str) -> dict[str, Any]:
+        """metadata of a cached value (without checking if it should be invalidated)"""
+
+
+SNAPSHOT_INDEX = "__index__.feather"
+_SNAPSHOT_FILENAME_RE = re.compile(r"[0-9a-f]{32}")
+_SNAPSHOT_INDEX_SCHEMA = pa.schema(
+    [
+        ("key", pa.string()),
+        ("filename", pa.string()),
+        ("format", pa.string()),
+        ("mtime", pa.float64()),
+        ("created_at", pa.float64()),
+        ("cost", pa.float64()),
+    ]
+)
+
 
 class InMemoryCache(Cache):
-    def __init__(self) -> None:
-        self._cache: dict[str, InMemoryCached] = {}
+    """
+    Cache keeping the dataframes in memory.
+    If `max_bytes` is set, the least valuable entries are evicted when the total (deep) memory
+    usage of the cached dataframes exceeds it:
+     - with the `LRU` policy, the least recently used entries are evicted first
+     - with the `GREEDY_DUAL` policy (GreedyDual-Size algorithm), entries with the lowest
+       load cost per byte are evicted first, while still aging the entries that are not used
+       anymore. A big dataframe which is cheap to reload will then be evicted before a small
+       one which is expensive to fetch.
+    If `compression` is set, the entries are kept compressed in memory (their size is then
+    the compressed one) and are decompressed on each hit.
+    Otherwise, `set` stores a copy of the dataframe and hits return copies of the cached ones
+    (see `safe_copy`), so that the cached values can't be modified by mistake. With pandas
+    copy-on-write mode, these copies are shallow and only the modified columns are copied.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int | None = None,
+        policy: EvictionPolicyEnum = EvictionPolicyEnum.LRU,
+        compression: CompressionEnum | None = None,
+    ) -> None:
+        super().__init__()
+        # entries are ordered from the least to the most recently used
+        self._cache: OrderedDict[str, InMemoryCached] = OrderedDict()
+        self.max_bytes = max_bytes
+        self.policy = EvictionPolicyEnum(policy)
+        self.compression = _validate_compression(compression)
+        self.size = 0
+        self._inflation = 0.0  # the "L" value of the GreedyDual-Size algorithm
+        # guards the entries, their order and the size (values are (de)compressed outside)
+        self._lock = RLock()
 
     def get(
-        self, key: str, mtime: float | None = None, expire: timedelta | None = None
+        self,
+        key: str,
+        mtime: float | None = None,
+        expire: timedelta | None = None,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
-        cached = self._cache[key]
-        if self.should_invalidate(
-            mtime=mtime,
-            cached_mtime=cached["mtime"],
-            expire=expire,
-            cached_created_at=cached["created_at"],
-        ):
-            self.delete(key)
-        return self._cache[key]["value"]
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and (
+                reason := self.invalidation_reason(
+                    mtime=mtime,
+                    cached_mtime=cached["mtime"],
+                    expire=expire,
+                    cached_created_at=cached["created_at"],
+                )
+            ):
+                self._remove(key, CacheEventEnum.INVALIDATION, reason)
+                cached = None
+            if cached is not None:
+                self._touch(key)
 
-    def set(self, key: str, value: pd.DataFrame, mtime: float | None = None) -> None:
-        mtime = mtime or time()
-        self._cache[key] = {"value": value, "mtime": mtime, "created_at": time()}
+        if cached is None:
+            self._notify(CacheEvent(CacheEventEnum.MISS, key))
+            raise KeyError(key)
+        self._notify(CacheEvent(CacheEventEnum.HIT, key, cost=cached["cost"] or 0.0))
+        if cached["codec"] is None:
+            value = cached["value"]
+            return safe_copy(value if columns is None else value[columns])
+        value = load_compressed(pa.BufferReader(cached["value"]), cached["codec"])
+        return value if columns is None else value[columns]
+
+    def set(
+        self,
+        key: str,
+        value: pd.DataFrame,
+        mtime: float | None = None,
+        cost: float | None = None,
+    ) -> None:
+        if self.compression is None:
+            value = safe_copy(value)
+        self._put(key, value, mtime=mtime or time(), created_at=time(), cost=cost)
+
+    def _put(
+        self,
+        key: str,
+        value: pd.DataFrame,
+        *,
+        mtime: float,
+        created_at: float,
+        cost: float | None,
+    ) -> None:
+        if self.compression is None:
+            size = int(value.memory_usage(index=True, deep=True).sum())
+            self._insert(key, value, None, size, mtime=mtime, created_at=created_at, cost=cost)
+        else:
+            sink = pa.BufferOutputStream()
+            dump_compressed(value, sink, self.compression)
+            stored = sink.getvalue()
+            self._insert(
+                key,
+                stored,
+                self.compression,
+                stored.size,
+                mtime=mtime,
+                created_at=created_at,
+                cost=cost,
+            )
+
+    def _insert(
+        self,
+        key: str,
+        stored: pd.DataFrame | pa.Buffer,
+        codec: CompressionEnum | None,
+        size: int,
+        *,
+        mtime: float,
+        created_at: float,
+        cost: float | None,
+    ) -> None:
+        with self._lock:
+            self._pop(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return  # would evict everything else without even fitting in the cache
+
+            self._cache[key] = {
+                "value": stored,
+                "codec": codec,
+                "mtime": mtime,
+                "created_at": created_at,
+                "size": size,
+                "cost": cost,
+                "priority": 0.0,
+            }
+            self.size += size
+            self._notify(CacheEvent(CacheEventEnum.SET, key, nbytes=size, cost=cost or 0.0))
+            self._touch(key)
+            self._evict()
 
     def delete(self, key: str) -> None:
-        if key in self._cache:
-            del self._cache[key]
+        self._remove(key)
+
+    def snapshot(self, path: str | Path) -> None:
+        """
+        Write the entries and their metadata in the `path` directory: values as uncompressed
+        feather files when possible (compressed entries are written as is), and an index of
+        the entries as a feather file. Files of a previous snapshot are replaced.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            entries = list(self._cache.items())  # from the least to the most recently used
+
+        rows = []
+        for key, cached in entries:
+            filename = md5(key.encode("utf-8")).hexdigest()
+            tmp_path = path / f".{filename}.{uuid4().hex}.tmp"
+            value = cached["value"]
+            if cached["codec"] is not None:
+                format = cached["codec"].value
+                with pa.OSFile(str(tmp_path), "wb") as f:
+                    f.write(value)
+            else:
+                if (table := dataframe_to_table(value)) is not None:
+                    feather.write_feather(table, tmp_path, compression="uncompressed")
+                    format = "feather"
+                else:
+                    value.to_pickle(tmp_path)
+                    format = "pickle"
+            # replaced files stay readable by the processes which memory-mapped them
+            os.replace(tmp_path, path / filename)
+            rows.append(
+                {
+                    "key": key,
+                    "filename": filename,
+                    "format": format,
+                    "mtime": cached["mtime"],
+                    "created_at": cached["created_at"],
+                    "cost": cached["cost"],
+                }
+            )
+
+        index = pa.Table.from_pylist(rows, schema=_SNAPSHOT_INDEX_SCHEMA)
+        tmp_path = path / f".{SNAPSHOT_INDEX}.{uuid4().hex}.tmp"
+        feather.write_feather(index, tmp_path)
+        os.replace(tmp_path, path / SNAPSHOT_INDEX)
+
+        filenames = {row["filename"] for row in rows}
+        for file_path in path.iterdir():
+            if _SNAPSHOT_FILENAME_RE.fullmatch(file_path.name) and file_path.name not in filenames:
+                file_path.unlink()
+
+    def restore(self, path: str | Path) -> None:
+        """
+        Add the entries of a snapshot (see `snapshot`) to the cache, with their original mtime
+        and creation date. Feather values and compressed values are memory-mapped, so they are
+        only actually read from disk when they are used.
+        """
+        path = Path(path)
+        for row in feather.read_table(path / SNAPSHOT_INDEX).to_pylist():
+            file_path = path / row["filename"]
+            infos = {"mtime": row["mtime"], "created_at": row["created_at"], "cost": row["cost"]}
+            if row["format"] == "feather":
+                table = feather.read_table(file_path, memory_map=True)
+                self._put(row["key"], table_to_dataframe(table), **infos)
+            elif row["format"] == "pickle":
+                self._put(row["key"], pd.read_pickle(file_path), **infos)
+            else:
+                stored = pa.memory_map(str(file_path)).read_buffer()
+                codec = CompressionEnum(row["format"])
+                self._insert(row["key"], stored, codec, stored.size, **infos)
+
+    def get_infos(self, key: str) -> dict[str, Any]:
+        with self._lock:
+            cached = self._cache[key]
+        return {
+            "mtime": cached["mtime"],
+            "created_at": cached["created_at"],
+            "codec": cached["codec"].value if cached["codec"] is not None else None,
+            "size": cached["size"],
+            "cost": cached["cost"],
+        }
+
+    def _remove(
+        self,
+        key: str,
+        kind: CacheEventEnum = CacheEventEnum.DELETE,
+        reason: InvalidationReasonEnum | None = None,
+    ) -> None:
+        with self._lock:
+            cached = self._pop(key)
+        if cached is not None:
+            self._notify(CacheEvent(kind, key, nbytes=cached["size"], reason=reason))
+
+    def _pop(self, key: str) -> InMemoryCached | None:
+        cached = self._cache.pop(key, None)
+        if cached is not None:
+            self.size -= cached["size"]
+        return cached
+
+    def _touch(self, key: str) -> None:
+        """mark an entry as used"""
+        cached = self._cache[key]
+        # unknown costs are all the same, so that only the size matters
+        cost = cached["cost"] if cached["cost"] is not None else 1.0
+        cached["priority"] = self._inflation + cost / max(cached["size"], 1)
+        self._cache.move_to_end(key)
+
+    def _evict(self) -> None:
+        while self.max_bytes is not None and self.size > self.max_bytes:
+            if self.policy is EvictionPolicyEnum.GREEDY_DUAL:
+                # in case of equality, the least recently used entry is evicted
+                key = min(self._cache, key=lambda k: self._cache[k]["priority"])
+                self._inflation = self._cache[key]["priority"]
+            else:
+                key = next(iter(self._cache))
+            self._remove(key, CacheEventEnum.EVICTION)
+
 
+META_DB_KEY = "__meta__.sqlite"
+_SQLITE_TIMEOUT = 30  # seconds to wait for the lock of another writer
+# without `max_bytes`, the last access of an entry (only used by `gc(max_idle)` then) is
+# recorded at most once per interval, so that hits don't wait for the lock of the writers
+_TOUCH_INTERVAL = 60
+_EVICTION_BATCH_SIZE = 16
+_TMP_FILES_MAX_AGE = 3600  # seconds after which a temporary file is considered orphaned
 
-META_DF_KEY = "__meta__"
+
+class MetadataStore:
+    """
+    sqlite index of the entries of a `PickleCache`, shared by all the processes using the
+    same `cache_dir`. Each row contains the metadata (e.g. last mtime and created_at fields)
+    of a cached datasource, identified by its key (= its hash).
+    The database is in WAL mode so that readers are never blocked by a writer and writers
+    are serialized by sqlite's own file locking.
+    If the database is corrupted, an empty one is recreated.
+    """
+
+    columns: dict[str, str] = {
+        "key": "TEXT PRIMARY KEY",
+        "mtime": "REAL",
+        "created_at": "REAL",
+        "codec": "TEXT",
+        "size": "INTEGER",
+        "cost": "REAL",
+        "last_access": "REAL",
+    }
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        try:
+            self._init_db()
+        except sqlite3.DatabaseError as e:
+            # e.g. a lock timeout or an unwritable directory: the database is not corrupted
+            if isinstance(e, sqlite3.OperationalError):
+                raise
+            for suffix in ("", "-wal", "-shm"):
+                with suppress(FileNotFoundError):
+                    Path(f"{self.path}{suffix}").unlink()
+            self._init_db()
+
+    def _init_db(self) -> None:
+        with self.connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            columns = ", ".join(f"{name} {type_}" for name, type_ in self.columns.items())
+            conn.execute(f"CREATE TABLE IF NOT EXISTS metadata ({columns})")
+            # add the columns missing in a database created by an older version
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(metadata)")}
+            for name, type_ in self.columns.items():
+                if name not in existing:
+                    conn.execute(f"ALTER TABLE metadata ADD COLUMN {name} {type_}")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS metadata_last_access "
+                "ON metadata (COALESCE(last_access, created_at))"
+            )
+
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=_SQLITE_TIMEOUT, isolation_level=None)
+        try:
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA synchronous=NORMAL")
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """write transaction, holding the database lock until it's committed"""
+        with self.connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self.connect() as conn:
+            row = conn.execute("SELECT * FROM metadata WHERE key = ?", (key,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def touch(self, key: str) -> None:
+        """record the last access of a key"""
+        with self.connect() as conn:
+            conn.execute("UPDATE metadata SET last_access = ? WHERE key = ?", (time(), key))
+
+    @staticmethod
+    def upsert(conn: sqlite3.Connection, key: str, **infos: Any) -> None:
+        infos = {"key": key, **infos}
+        conn.execute(
+            f"INSERT OR REPLACE INTO metadata ({', '.join(infos)}) "
+            f"VALUES ({', '.join('?' * len(infos))})",
+            tuple(infos.values()),
+        )
+
+    @staticmethod
+    def remove(
+        conn: sqlite3.Connection, key: str, created_at: float | None = None
+    ) -> dict[str, Any] | None:
+        """
+        remove the row of a key and return it (if any)
+        If `created_at` is set, the row is only removed if it has not been replaced since.
+        """
+        row = conn.execute("SELECT * FROM metadata WHERE key = ?", (key,)).fetchone()
+        if row is None or (created_at is not None and row["created_at"] != created_at):
+            return None
+        conn.execute("DELETE FROM metadata WHERE key = ?", (key,))
+        return dict(row)
+
+    def to_frame(self) -> pd.DataFrame:
+        with self.connect() as conn:
+            rows = [dict(row) for row in conn.execute("SELECT * FROM metadata ORDER BY key")]
+        return pd.DataFrame(rows, columns=list(self.columns))
 
 
 class PickleCache(Cache):
-    def __init__(self, cache_dir: str | Path) -> None:
+    """
+    Cache persisting the dataframes as pickle files in `cache_dir`.
+    If `compression` is set, the files are compressed with this codec.
+    If `max_bytes` is set, the least recently used entries (by any process) are evicted when
+    the total size of the files exceeds it. The processes sharing `cache_dir` are expected to
+    set the same `max_bytes`, as the last accesses are only recorded precisely with a budget.
+    `gc` reconciles the metadata with the files of `cache_dir` (e.g. after a crash).
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        compression: CompressionEnum | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        super().__init__()
+        self.compression = _validate_compression(compression)
+        self.max_bytes = max_bytes
         self.cache_dir = Path(cache_dir).resolve()
-        self._meta_df_key = self.cache_dir / META_DF_KEY
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._metadata = MetadataStore(self.cache_dir / META_DB_KEY)
+
+    def get_infos(self, key: str) -> dict[str, Any]:
+        """metadata of a cached value (without checking if it should be invalidated)"""
+        infos = self._metadata.get(key)
+        if infos is None:
+            raise KeyError(key)
+        return infos
 
     def get_metadata(self) -> pd.DataFrame:
         """
-        metadata is a dataframe containing last mtime and created_at fields
-        for each cached datasource, identified by its key (= its hash).
-        If metadata file is not found or is corrupted, an empty one is recreated.
+        metadata is a dataframe containing last mtime, created_at, codec, size, cost and
+        last_access fields for each cached datasource, identified by its key (= its hash).
         """
-        try:
-            metadata = pd.read_pickle(self._meta_df_key)
-        except Exception:  # catch all, on purpose
-            metadata = pd.DataFrame(columns=["key", "mtime", "created_at"])
-            self.set_metadata(metadata)
-        return metadata
+        return self._metadata.to_frame()
 
     def set_metadata(self, df: pd.DataFrame) -> None:
-        df.to_pickle(self._meta_df_key)
+        with self._metadata.transaction() as conn:
+            conn.execute("DELETE FROM metadata")
+            for infos in df.to_dict(orient="records"):
+                self._metadata.upsert(conn, **infos)
+
+    def _dump(self, value: pd.DataFrame, path: Path) -> None:
+        """write a cached value on disk"""
+        if self.compression is None:
+            value.to_pickle(path)
+        else:
+            dump_compressed(value, str(path), self.compression)
+
+    def _load(self, path: Path, columns: list[str] | None = None) -> pd.DataFrame:
+        """read a cached value from disk"""
+        # the codec is detected from the file itself rather than read from the metadata,
+        # in case the entry has been rewritten by another process in the meantime
+        with open(path, "rb") as f:
+            magic = f.read(4)
+        for codec, codec_magic in _CODEC_MAGICS.items():
+            if magic == codec_magic:
+                value = load_compressed(pa.OSFile(str(path)), codec)
+                break
+        else:
+            value = pd.read_pickle(path)
+        return value if columns is None else value[columns]
 
     def get(
-        self, key: str, mtime: float | None = None, expire: timedelta | None = None
+        self,
+        key: str,
+        mtime: float | None = None,
+        expire: timedelta | None = None,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
-        metadata = self.get_metadata()
-        try:
-            # look for the row concerning the desired key in the metadata dataframe:
-            infos = metadata[metadata.key == key].iloc[0].to_dict()
-        except IndexError:
-            raise KeyError(key)
-
-        if self.should_invalidate(
-            mtime=mtime,
-            cached_mtime=infos["mtime"],
-            expire=expire,
-            cached_created_at=infos["created_at"],
+        infos = self._metadata.get(key)
+        if infos is not None and (
+            reason := self.invalidation_reason(
+                mtime=mtime,
+                cached_mtime=infos["mtime"],
+                expire=expire,
+                cached_created_at=infos["created_at"],
+            )
         ):
-            self.delete(key)
+            self._remove(key, CacheEventEnum.INVALIDATION, reason, infos["created_at"])
+            infos = None
 
-        try:
-            return pd.read_pickle(self.cache_dir / key)
-        except FileNotFoundError:
-            raise KeyError(key)
+        if infos is not None:
+            with suppress(FileNotFoundError):
+                value = self._load(self.cache_dir / key, columns)
+                if (
+                    self.max_bytes is not None
+                    or time() >= (infos["last_access"] or 0) + _TOUCH_INTERVAL
+                ):
+                    self._metadata.touch(key)
+                self._notify(CacheEvent(CacheEventEnum.HIT, key, cost=infos["cost"] or 0.0))
+                return value
+
+        self._notify(CacheEvent(CacheEventEnum.MISS, key))
+        raise KeyError(key)
 
-    def set(self, key: str, value: pd.DataFrame, mtime: float | None = None) -> None:
+    def set(
+        self,
+        key: str,
+        value: pd.DataFrame,
+        mtime: float | None = None,
+        cost: float | None = None,
+    ) -> None:
         mtime = mtime or time()
-        infos = {"key": key, "mtime": mtime, "created_at": time()}
-        metadata = self.get_metadata()
+        path = self.cache_dir / key
+        # the value is written in a temporary file, which then atomically replaces the entry,
+        # so that a concurrent reader never sees a partially written file
+        tmp_path = path.with_name(f".{key}.{uuid4().hex}.tmp")
         try:
-            # add new row to the metadata dataframe:
-            metadata = metadata[metadata.key != key]  # drop duplicates
-            metadata = pd.concat([metadata, pd.Series(infos).to_frame().T], ignore_index=True)
-            self.set_metadata(metadata)
-            value.to_pickle(self.cache_dir / key)
+            self._dump(value, tmp_path)
+            size = tmp_path.stat().st_size
+            with self._metadata.transaction() as conn:
+                os.replace(tmp_path, path)
+                created_at = time()
+                self._metadata.upsert(
+                    conn,
+                    key,
+                    mtime=mtime,
+                    created_at=created_at,
+                    codec=self.compression.value if self.compression is not None else None,
+                    size=size,
+                    cost=cost,
+                    last_access=created_at,
+                )
         except OSError:
+            with suppress(FileNotFoundError):
+                tmp_path.unlink()
             self.delete(key)
             raise
+        self._notify(CacheEvent(CacheEventEnum.SET, key, nbytes=size, cost=cost or 0.0))
+        self._evict(key)
+
+    def _evict(self, key: str | None = None) -> None:
+        """evict the least recently used entries (the newly set `key` last)"""
+        if self.max_bytes is None:
+            return
+        evicted = []
+        with self._metadata.transaction() as conn:
+            total_size = conn.execute("SELECT COALESCE(SUM(size), 0) FROM metadata").fetchone()[0]
+            for row in self._eviction_candidates(conn, key):
+                if total_size <= self.max_bytes:
+                    break
+                self._metadata.remove(conn, row["key"])
+                with suppress(FileNotFoundError):
+                    (self.cache_dir / row["key"]).unlink()
+                total_size -= row["size"] or 0
+                evicted.append(row)
+        for row in evicted:
+            self._notify(CacheEvent(CacheEventEnum.EVICTION, row["key"], nbytes=row["size"] or 0))
+
+    def _eviction_candidates(
+        self, conn: sqlite3.Connection, key: str | None
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Entries in eviction order, each one being expected to be removed before the next one
+        is asked: they are fetched by small batches following the index on the last access,
+        rather than by sorting the whole table.
+        """
+        assert self.max_bytes is not None
+        new_row = conn.execute("SELECT key, size FROM metadata WHERE key = ?", (key,)).fetchone()
+        if new_row is not None and (new_row["size"] or 0) > self.max_bytes:
+            yield dict(new_row)  # would evict everything else without even fitting in the cache
+            return
+        while rows := conn.execute(
+            "SELECT key, size FROM metadata WHERE key IS NOT ? "
+            "ORDER BY COALESCE(last_access, created_at) LIMIT ?",
+            (key, _EVICTION_BATCH_SIZE),
+        ).fetchall():
+            for row in rows:
+                yield dict(row)
+        if new_row is not None:
+            yield dict(new_row)
+
+    def gc(self, max_idle: timedelta | None = None) -> None:
+        """
+        Reconcile the metadata with the files of `cache_dir`:
+         - entries whose file is missing are deleted
+         - files without entry (e.g. left by a failed write) are removed
+         - entries not accessed for `max_idle` (e.g. of datasources which are not used anymore)
+           and the least recently used ones above `max_bytes` are evicted
+        """
+        now = time()
+        events = []
+        with self._metadata.transaction() as conn:
+            rows = {row["key"]: dict(row) for row in conn.execute("SELECT * FROM metadata")}
+            for key, row in rows.items():
+                last_access = row["last_access"] or row["created_at"]
+                if not (self.cache_dir / key).is_file():
+                    kind = CacheEventEnum.DELETE
+                elif max_idle is not None and now > last_access + max_idle.total_seconds():
+                    kind = CacheEventEnum.EVICTION
+                else:
+                    continue
+                self._metadata.remove(conn, key)
+                with suppress(FileNotFoundError):
+                    (self.cache_dir / key).unlink()
+                events.append(CacheEvent(kind, key, nbytes=row["size"] or 0))
+
+            for path in self.cache_dir.iterdir():
+                if path.name in rows or path.name.startswith(META_DB_KEY) or not path.is_file():
+                    continue
+                # temporary files may be being written by another process
+                if path.suffix == ".tmp" and now < path.stat().st_mtime + _TMP_FILES_MAX_AGE:
+                    continue
+                with suppress(FileNotFoundError):
+                    path.unlink()
+
+        for event in events:
+            self._notify(event)
+        self._evict()
+
+    def delete(self, key: str) -> None:
+        self._remove(key)
+
+    def _remove(
+        self,
+        key: str,
+        kind: CacheEventEnum = CacheEventEnum.DELETE,
+        reason: InvalidationReasonEnum | None = None,
+        created_at: float | None = None,
+    ) -> None:
+        with self._metadata.transaction() as conn:
+            infos = self._metadata.remove(conn, key, created_at)
+            if infos is not None or created_at is None:
+                with suppress(FileNotFoundError):
+                    (self.cache_dir / key).unlink()
+        if infos is not None:
+            self._notify(CacheEvent(kind, key, nbytes=infos["size"] or 0, reason=reason))
+
+
+ARROW_MAGIC = b"ARROW1"
+
+
+class ArrowCache(PickleCache):
+    """
+    Same as `PickleCache` but values are persisted as Arrow IPC (feather v2) or parquet files.
+    Feather files are written uncompressed so that they can be memory-mapped: a cache hit
+    does not deserialize the whole file and only the requested `columns` are read.
+    Like for the other caches, the returned dataframes are copies which can be modified: with
+    pandas copy-on-write mode, these copies are shallow views on the mapped file and only the
+    modified columns are copied.
+    Values which can't be converted exactly to arrow (e.g. columns with mixed types, see
+    `dataframe_to_table`) are pickled.
+    Compressed feather files can't be memory-mapped: with `compression`, hits are cheaper in
+    disk space but not zero-copy anymore.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        format: ArrowFormatEnum = ArrowFormatEnum.FEATHER,
+        compression: CompressionEnum | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        super().__init__(cache_dir, compression=compression, max_bytes=max_bytes)
+        self.format = ArrowFormatEnum(format)
+
+    def _dump(self, value: pd.DataFrame, path: Path) -> None:
+        if (table := dataframe_to_table(value)) is None:
+            return super()._dump(value, path)
+
+        codec = self.compression.value if self.compression is not None else None
+        if self.format is ArrowFormatEnum.PARQUET:
+            pq.write_table(table, path, compression=codec or "none")
+        else:
+            feather.write_feather(table, path, compression=codec or "uncompressed")
+
+    def _load(self, path: Path, columns: list[str] | None = None) -> pd.DataFrame:
+        with open(path, "rb") as f:
+            magic = f.read(len(ARROW_MAGIC))
+
+        if magic == ARROW_MAGIC:
+            table = feather.read_table(path, columns=columns, memory_map=True)
+        elif magic.startswith(b"PAR1"):
+            table = pq.read_table(path, columns=columns, memory_map=True)
+        else:
+            return super()._load(path, columns)
+        # zero-copy columns are read-only views on the mapped file
+        return safe_copy(table_to_dataframe(table))
+
+
+# RAM-backed filesystem, shared by all the processes of the host
+SHM_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+class SharedMemoryCache(ArrowCache):
+    """
+    Cache shared by all the processes of the same host (e.g. forked web workers): entries are
+    uncompressed feather files in shared memory (a `name` directory in `shm_dir`, /dev/shm by
+    default), indexed by the same sqlite database as `PickleCache`.
+    Each process memory-maps the entries it reads, so that, with pandas copy-on-write mode, the
+    bytes of a cached dataframe are held only once in RAM for all of them.
+    Its `max_bytes` budget is then a RAM one. An evicted file is only unlinked: the kernel keeps
+    its pages until the last process which mapped it releases its dataframes.
+    """
+
+    def __init__(
+        self,
+        name: str = "peakina",
+        max_bytes: int | None = None,
+        shm_dir: str | Path = SHM_DIR,
+    ) -> None:
+        super().__init__(Path(shm_dir) / name, max_bytes=max_bytes)
+
+
+class TieredCache(Cache):
+    """
+    Two-tier cache: an `InMemoryCache` (see its `max_bytes` and `policy` parameters)
+    in front of a persistent cache (`CacheEnum.PICKLE` or `CacheEnum.ARROW`) in `cache_dir`,
+    optionally compressed with `compression`.
+    Values are looked up in memory first, then on disk, and disk hits are promoted in memory
+    with their original mtime and creation date, so that they are invalidated at the same time
+    on both tiers. Values are always written on both tiers.
+    Its stats are the ones of the persistent tier, plus the hits of the in-memory tier
+    (`memory.stats()` gives the in-memory tier ones, e.g. its evictions).
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        *,
+        persistent: CacheEnum = CacheEnum.PICKLE,
+        max_bytes: int | None = None,
+        policy: EvictionPolicyEnum = EvictionPolicyEnum.LRU,
+        compression: CompressionEnum | None = None,
+    ) -> None:
+        super().__init__()
+        self.memory = InMemoryCache(max_bytes=max_bytes, policy=policy)
+        self.persistent: PickleCache
+        if persistent == CacheEnum.PICKLE:
+            self.persistent = PickleCache(cache_dir, compression=compression)
+        elif persistent == CacheEnum.ARROW:
+            self.persistent = ArrowCache(cache_dir, compression=compression)
+        else:
+            raise ValueError(f"Invalid persistent cache {persistent!r}")
+        self.memory.add_observer(self._on_memory_event)
+        self.persistent.add_observer(self._notify)
+
+    def _on_memory_event(self, event: CacheEvent) -> None:
+        if event.kind is CacheEventEnum.HIT:
+            self._notify(event)
+
+    def get(
+        self,
+        key: str,
+        mtime: float | None = None,
+        expire: timedelta | None = None,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        with suppress(KeyError):
+            return self.memory.get(key, mtime=mtime, expire=expire, columns=columns)
+
+        if columns is not None:
+            # partial values are not promoted
+            return self.persistent.get(key, mtime=mtime, expire=expire, columns=columns)
+
+        value = self.persistent.get(key, mtime=mtime, expire=expire)
+        with suppress(KeyError):  # the value may have been deleted in the meantime
+            infos = self.persistent.get_infos(key)
+            self.memory._put(
+                key,
+                value,
+                mtime=infos["mtime"],
+                created_at=infos["created_at"],
+                cost=infos["cost"],
+            )
+            return safe_copy(value)  # the promoted value is not shared with the caller
+        return value
+
+    def set(
+        self,
+        key: str,
+        value: pd.DataFrame,
+        mtime: float | None = None,
+        cost: float | None = None,
+    ) -> None:
+        mtime = mtime or time()
+        self.persistent.set(key, value, mtime=mtime, cost=cost)
+        self.memory.set(key, value, mtime=mtime, cost=cost)
 
     def delete(self, key: str) -> None:
-        metadata = self.get_metadata()
-        metadata = metadata[metadata.key != key]
-        self.set_metadata(metadata)
-        with suppress(FileNotFoundError):
-            (self.cache_dir / key).unlink()
+        self.memory.delete(key)
+        self.persistent.delete(key)
+
+    def get_infos(self, key: str) -> dict[str, Any]:
+        with suppress(KeyError):
+            return self.memory.get_infos(key)
+        return self.persistent.get_infos(key)
+
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent loads: while a load is running for a key, the other callers
+    asking for the same key wait for its result (or its exception) instead of loading it again.
+    The result is shared by all the callers, unless `copy` is given: the waiting callers then
+    get `copy(result)`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._calls: dict[Hashable, Future[Any]] = {}
+
+    def do(self, key: Hashable, load: Callable[[], T], copy: Callable[[T], T] | None = None) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+        if not is_leader:
+            result = cast(T, future.result())
+            return result if copy is None else copy(result)
+
+        try:
+            result = load()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
 
 
 # taken from https://gist.github.com/Morreski/c1d08a3afa4040815eafd3891e16b945
@@ -32,5 +32,12 @@ class DataPool:
     def __getitem__(self, item: Hashable) -> "pd.DataFrame":
         return self.datasources[item].get_df(cache=self.cache)
 
+    async def aget(self, item: Hashable) -> "pd.DataFrame":
+        """Same as `pool[item]`, without blocking the event loop"""
+        return await self.datasources[item].aget_df(cache=self.cache)
+
     def __len__(self) -> int:
         return len(self.datasources)
+
+    def get_metadata(self, item: Hashable) -> dict[str, Any]:
+        return self.datasources[item].get_metadata(cache=self.cache)
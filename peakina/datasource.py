@@ -5,27 +5,40 @@ encoding, separator...and its only method is `get_df` to retrieve the pandas Dat
 the given parameters.
 """
 
+import asyncio
+import json
+import logging
 import os
+from collections import deque
 from contextlib import suppress
-from dataclasses import asdict, field
+from dataclasses import asdict, field, fields
 from datetime import timedelta
+from functools import lru_cache
 from hashlib import md5
-from typing import IO, Any, Generator, Iterable
+from itertools import islice
+from threading import Lock, Thread
+from time import perf_counter
+from typing import IO, Any, AsyncGenerator, Generator, Iterable
 from urllib.parse import urlparse, uses_netloc, uses_params, uses_relative
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from pydantic import ConfigDict
 from pydantic.dataclasses import dataclass
 from slugify import slugify
 
-from peakina.cache import Cache
+from peakina.cache import Cache, InvalidationReasonEnum, SingleFlight, safe_copy
+from peakina.executors import aiterate, amap_ordered, map_ordered, pd_read_in_process
 from peakina.helpers import (
     TypeEnum,
+    arrow_read,
     detect_encoding,
     detect_sep,
     detect_type,
     get_metadata,
     get_reader_allowed_params,
+    get_reader_defaults,
     pd_read,
     validate_encoding,
     validate_kwargs,
@@ -36,6 +49,126 @@ from peakina.io import Fetcher, MatchEnum
 AVAILABLE_SCHEMES = set(Fetcher.registry) - {""}  # discard the empty string scheme
 PD_VALID_URLS = set(uses_relative + uses_netloc + uses_params) | AVAILABLE_SCHEMES
 
+logger = logging.getLogger(__name__)
+
+# reader kwargs which only select some rows or columns of the full dataframe,
+# with the file types for which they are applied as such by the readers
+SLICING_READER_KWARGS: dict[str, set[TypeEnum]] = {
+    "preview_offset": {TypeEnum.CSV, TypeEnum.EXCEL, TypeEnum.PARQUET},
+    "preview_nrows": {TypeEnum.CSV, TypeEnum.EXCEL, TypeEnum.PARQUET},
+    "nrows": {TypeEnum.CSV, TypeEnum.EXCEL},
+    "usecols": {TypeEnum.CSV},
+    "columns": {TypeEnum.PARQUET},
+}
+# reader kwargs changing the way the slicing kwargs are applied
+_UNSLICEABLE_READER_KWARGS = {"chunksize", "skiprows", "skipfooter"}
+
+# concurrent loads of the same cold datasource in the same cache are only done once
+_single_flight = SingleFlight()
+# same for the concurrent loads of the same event loop
+_async_loads: dict[tuple[int, int, str], "asyncio.Task[list[pd.DataFrame]]"] = {}
+
+# keys of the cached values being refreshed in background (see `DataSource.max_stale`)
+_refreshing: set[str] = set()
+_refreshing_lock = Lock()
+
+
+# kinds of the numpy dtypes of the columns which can be concatenated as Arrow tables:
+# booleans, numbers, datetimes, timedeltas and strings (object)
+_ARROW_CONCAT_DTYPE_KINDS = set("biufmMO")
+
+
+def _arrow_concat(parts: list[pd.DataFrame]) -> pd.DataFrame | None:
+    """
+    Concatenate dataframes with the same columns and dtypes by assembling them in a single
+    Arrow table, converted to pandas at once: unlike `pd.concat` followed by `reset_index`,
+    there is only one concatenated copy, and `parts` is emptied so that the dataframes can be
+    released while it's built.
+    Returns None (and leaves `parts` untouched) if the dataframes can't be concatenated exactly
+    this way, e.g. if they have different dtypes or object columns which are not strings.
+    """
+    if len(parts) < 2:
+        return None
+    first = parts[0]
+    if (
+        any(type(df) is not pd.DataFrame for df in parts)
+        or not first.columns.is_unique
+        or not all(isinstance(c, str) for c in first.columns)
+        or not all(
+            isinstance(dtype, np.dtype) and dtype.kind in _ARROW_CONCAT_DTYPE_KINDS
+            for dtype in first.dtypes
+        )
+        or any(not df.dtypes.equals(first.dtypes) for df in parts[1:])
+    ):
+        return None
+
+    try:
+        tables = [pa.Table.from_pandas(df, preserve_index=False) for df in parts]
+        table = pa.concat_tables(tables)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+    object_columns = [c for c, dtype in first.dtypes.items() if dtype.kind == "O"]
+    if any(not pa.types.is_string(table.schema.field(c).type) for c in object_columns):
+        return None  # e.g. lists or dicts, which wouldn't be converted back as such
+    # missing strings are converted back to None: keep the NaN of the pandas readers, if any
+    null_values = {}
+    for column in object_columns:
+        if table.column(column).null_count:
+            nulls = next(nulls for df in parts if (nulls := df[column][df[column].isna()]).size)
+            null_values[column] = nulls.iloc[0]
+
+    parts.clear()
+    del tables
+    df = table.to_pandas(self_destruct=True, split_blocks=True)
+    del table
+    for column, null_value in null_values.items():
+        if null_value is not None:
+            df[column] = df[column].where(df[column].notna(), null_value)
+    # columns made of a single chunk are not copied and are then read-only
+    if any(not df[c].to_numpy(copy=False).flags.writeable for c in df.columns):
+        df = df.copy()
+    return df
+
+
+# fields which don't change the data of a datasource, hence not part of its hash
+NON_IDENTITY_FIELDS = (
+    "expire",
+    "max_stale",
+    "revalidate_after",
+    "max_workers",
+    "parse_in_processes",
+)
+_NO_DEFAULT = object()
+
+
+def _is_default(value: Any, default: Any) -> bool:
+    try:
+        return type(value) is type(default) and bool(value == default)
+    except (TypeError, ValueError):  # e.g. ambiguous truth value of an array
+        return False
+
+
+def _canonical(value: Any) -> Any:
+    """
+    Value whose JSON dump is canonical: dicts whose keys are not all strings (e.g. a `dtype`
+    mapping column names and positions), which can't be sorted, become lists of key-value pairs
+    sorted by the type and the repr of their keys.
+    """
+    if isinstance(value, dict):
+        if all(isinstance(k, str) for k in value):
+            return {k: _canonical(v) for k, v in value.items()}
+        items = sorted(value.items(), key=lambda kv: (type(kv[0]).__name__, repr(kv[0])))
+        return [[k, _canonical(v)] for k, v in items]
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _hash_identifier(filename: str, canonical_identifier: str) -> str:
+    hash_ = md5(canonical_identifier.encode("utf-8")).hexdigest()
+    return f"_{slugify(filename, separator='_')}_{hash_}"
+
 
 @dataclass
 class DataSource:
@@ -43,11 +176,27 @@ class DataSource:
     type: TypeEnum | None = None
     match: MatchEnum | None = None
     expire: timedelta | None = None
+    # once expired, a cached value can still be returned during `max_stale`
+    # while it is refreshed in background
+    max_stale: timedelta | None = None
+    # the modification time of the files of a cached datasource is not checked again
+    # during `revalidate_after` after a check
+    revalidate_after: timedelta | None = None
     reader_kwargs: dict[str, Any] = field(default_factory=dict)
     fetcher_kwargs: dict[str, Any] = field(default_factory=dict)
+    # the matched files are fetched and read concurrently by `max_workers` threads
+    max_workers: int | None = None
+    # the files are parsed in the worker processes of a shared process pool, which is faster
+    # for formats whose parsing holds the GIL (e.g. xml, json or csv with the python engine)
+    parse_in_processes: bool = False
 
     def __post_init__(self) -> None:
         self._fetcher: Fetcher | None = None
+        # reader kwargs set by peakina itself (e.g. detected encoding), which are not part of
+        # the identity of the datasource
+        self._detected_kwargs: set[str] = set()
+        # last computed hash, with the identity it was computed from
+        self._hash_memo: tuple[tuple[Any, ...], str] | None = None
         self.scheme = urlparse(self.uri).scheme
         if self.scheme not in PD_VALID_URLS:
             raise AttributeError(f"Invalid scheme {self.scheme!r}")
@@ -68,16 +217,71 @@ class DataSource:
 
     @property
     def hash(self) -> str:
-        identifier = asdict(self)
-        del identifier["expire"]
-        hash_ = md5(str(identifier).encode("utf-8")).hexdigest()
-        filename = slugify(os.path.basename(self.uri), separator="_")
-        return f"_{filename}_{hash_}"
-
-    def get_metadata(self) -> dict[str, Any]:
-        """Return datasource metadata (e.g. excel sheetnames)"""
+        """
+        Canonical key of the datasource: only the fields defining the data are used, and the
+        reader kwargs are sorted, without the detected ones and the ones set to their default.
+        It is memoized until a field or a (top-level) reader or fetcher kwarg is changed.
+        """
+        identifier = {f.name: getattr(self, f.name) for f in fields(self)}
+        for name in NON_IDENTITY_FIELDS:
+            del identifier[name]
+        memo_key = (
+            *(tuple(v.items()) if isinstance(v, dict) else v for v in identifier.values()),
+            frozenset(self._detected_kwargs),
+        )
+        with suppress(TypeError, ValueError):  # e.g. ambiguous truth value of an array
+            if self._hash_memo is not None and self._hash_memo[0] == memo_key:
+                return self._hash_memo[1]
+
+        defaults = get_reader_defaults(self.type) if self.type is not None else {}
+        identifier["reader_kwargs"] = {
+            k: v
+            for k, v in self.reader_kwargs.items()
+            if k not in self._detected_kwargs and not _is_default(v, defaults.get(k, _NO_DEFAULT))
+        }
+        canonical_identifier = json.dumps(_canonical(identifier), sort_keys=True, default=str)
+        self._hash_memo = (
+            memo_key,
+            _hash_identifier(os.path.basename(self.uri), canonical_identifier),
+        )
+        return self._hash_memo[1]
+
+    def get_metadata(self, cache: Cache | None = None) -> dict[str, Any]:
+        """
+        Return datasource metadata (e.g. excel sheetnames)
+        With a `cache`, metadata are cached until the file changes (or expires, if its
+        modification time is unknown).
+        """
         if self.match:
             return {}  # no metadata for matched datasources
+
+        if cache is None:
+            return self._read_metadata()
+        cache_mtime = self._get_cache_mtime(self, cache)
+        if cache_mtime is None and self.expire is None:
+            return self._read_metadata()
+
+        cache_key = f"{self.hash}__metadata"
+        with suppress(KeyError):
+            cached = cache.get(key=cache_key, mtime=cache_mtime, expire=self.expire)
+            # restore the detected encoding, as if the metadata had been read
+            detected = json.loads(cached["reader_kwargs"].iloc[0])
+            self.reader_kwargs.update(detected)
+            self._detected_kwargs.update(detected)
+            metadata: dict[str, Any] = json.loads(cached["metadata"].iloc[0])
+            return metadata
+
+        started_at = perf_counter()
+        metadata = self._read_metadata()
+        detected = {k: v for k, v in self.reader_kwargs.items() if k in self._detected_kwargs}
+        cached = pd.DataFrame(
+            {"metadata": [json.dumps(metadata)], "reader_kwargs": [json.dumps(detected)]}
+        )
+        cost = perf_counter() - started_at
+        cache.set(key=cache_key, value=cached, mtime=cache_mtime, cost=cost)
+        return metadata
+
+    def _read_metadata(self) -> dict[str, Any]:
         with self.fetcher.open(self.uri) as f:
             assert self.type is not None
 
@@ -87,47 +291,192 @@ class DataSource:
             if "encoding" in allowed_params:
                 if not validate_encoding(f.name, encoding):
                     encoding = detect_encoding(f.name)
+                if "encoding" not in self.reader_kwargs:
+                    self._detected_kwargs.add("encoding")
                 self.reader_kwargs["encoding"] = encoding
 
             return get_metadata(f.name, self.type, self.reader_kwargs)
 
     @staticmethod
-    def _get_single_df(
-        stream: IO[bytes] | IO[str], filetype: TypeEnum | None, **kwargs: Any
-    ) -> pd.DataFrame | Iterable[pd.DataFrame]:
-        """
-        Read a stream and retrieve the data frame or data frame generator (chunks)
-        It uses `stream.name`, which is the path to a local file (often temporary)
-        to avoid closing it. It will be closed at the end of the method.
-        """
-        if filetype is None:
-            filetype = TypeEnum(detect_type(stream.name))
+    def _detect_kwargs(filepath: str, filetype: TypeEnum, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Check the encoding and the separator of a file, and detect them if needed"""
+        detected = {}
         allowed_params = get_reader_allowed_params(filetype)
 
         # Check encoding
         encoding = kwargs.get("encoding")
         if "encoding" in allowed_params:
-            if not validate_encoding(stream.name, encoding):
-                encoding = detect_encoding(stream.name)
-            kwargs["encoding"] = encoding
+            if not validate_encoding(filepath, encoding):
+                encoding = detect_encoding(filepath)
+            detected["encoding"] = encoding
 
         # Check separator for CSV files if it's not set
         if "sep" in allowed_params and "sep" not in kwargs:
-            if not validate_sep(stream.name, encoding=encoding):
-                kwargs["sep"] = detect_sep(stream.name, encoding)
+            if not validate_sep(filepath, encoding=encoding):
+                detected["sep"] = detect_sep(filepath, encoding)
+
+        return detected
 
+    @staticmethod
+    def _get_single_df(
+        stream: IO[bytes] | IO[str],
+        filetype: TypeEnum | None,
+        detected_kwargs: dict[str, Any] | None = None,
+        in_process: bool = False,
+        **kwargs: Any,
+    ) -> pd.DataFrame | Iterable[pd.DataFrame]:
+        """
+        Read a stream and retrieve the data frame or data frame generator (chunks)
+        It uses `stream.name`, which is the path to a local file (often temporary)
+        to avoid closing it. It will be closed at the end of the method.
+        The encoding and separator are detected, unless `detected_kwargs` are given.
+        With `in_process`, the file is parsed in a worker process (unless read by chunk).
+        """
         try:
-            df = pd_read(stream.name, filetype, kwargs)
+            if filetype is None:
+                filetype = TypeEnum(detect_type(stream.name))
+            if detected_kwargs is None:
+                detected_kwargs = DataSource._detect_kwargs(stream.name, filetype, kwargs)
+            by_chunk = kwargs.get("chunksize") is not None
+            read = pd_read_in_process if in_process and not by_chunk else pd_read
+            df = read(stream.name, filetype, {**kwargs, **detected_kwargs})
         finally:
             stream.close()
 
         return df
 
     def get_matched_datasources(self) -> Generator["DataSource", None, None]:
-        my_args = asdict(self)
         for uri in self.fetcher.get_filepath_list(self.uri, self.match):
-            overriden_args = {**my_args, "uri": uri, "match": None}
-            yield DataSource(**overriden_args)
+            yield self._get_matched_datasource(uri)
+
+    async def aget_matched_datasources(self) -> list["DataSource"]:
+        uris = await self.fetcher.aget_filepath_list(self.uri, self.match)
+        return [self._get_matched_datasource(uri) for uri in uris]
+
+    def _get_matched_datasource(self, uri: str) -> "DataSource":
+        datasource = DataSource(**{**asdict(self), "uri": uri, "match": None})
+        datasource._detected_kwargs = self._detected_kwargs
+        return datasource
+
+    def _read_dfs(
+        self,
+        datasource: "DataSource",
+        cache: Cache | None = None,
+        cache_mtime: float | None = None,
+        stream: IO[bytes] | IO[str] | None = None,
+    ) -> Generator[pd.DataFrame, None, None]:
+        """
+        Fetch and read a (not matched) datasource, yielding its dataframe or its chunks
+        With a `cache`, the detected encoding and separator of the file are kept in it
+        (as long as the file doesn't change) to avoid detecting them again.
+        The file is not fetched if its `stream` is given.
+        """
+        by_chunk = self.reader_kwargs.get("chunksize") is not None
+        detected_kwargs = None
+        detected_key = f"{datasource.hash}__detected"
+        with_cache = cache is not None and cache_mtime is not None
+        if with_cache:
+            assert cache is not None
+            with suppress(KeyError):
+                detected = cache.get(key=detected_key, mtime=cache_mtime)
+                detected_kwargs = json.loads(detected["kwargs"].iloc[0])
+
+        if stream is None:
+            stream = self.fetcher.open(datasource.uri)
+        try:
+            if with_cache and detected_kwargs is None:
+                assert cache is not None
+                filetype = self.type or TypeEnum(detect_type(stream.name))
+                detected_kwargs = self._detect_kwargs(stream.name, filetype, self.reader_kwargs)
+                detected = pd.DataFrame({"kwargs": [json.dumps(detected_kwargs)]})
+                cache.set(key=detected_key, value=detected, mtime=cache_mtime)
+            df = self._get_single_df(
+                stream,
+                self.type,
+                detected_kwargs=detected_kwargs,
+                in_process=self.parse_in_processes,
+                **self.reader_kwargs,
+            )
+            dfs = df if by_chunk else [df]
+        except pd.errors.EmptyDataError:
+            stream.close()
+            dfs = [pd.DataFrame()]
+
+        for df in dfs:
+            if self.match:
+                df["__filename__"] = os.path.basename(datasource.uri)  # type:ignore[index]
+            yield df
+
+    def _get_cache_mtime(self, datasource: "DataSource", cache: Cache) -> float | None:
+        cache_key = datasource.hash
+        if self.revalidate_after is not None:
+            with suppress(KeyError):
+                return cache.get_checked_mtime(cache_key, self.revalidate_after)
+
+        with suppress(NotImplementedError, KeyError, OSError):
+            mtime = self.fetcher.mtime(datasource.uri)
+            if mtime is not None:
+                cache.set_checked_mtime(cache_key, mtime)
+            return mtime
+        return None
+
+    async def _aget_cache_mtime(self, datasource: "DataSource", cache: Cache) -> float | None:
+        cache_key = datasource.hash
+        if self.revalidate_after is not None:
+            with suppress(KeyError):
+                return cache.get_checked_mtime(cache_key, self.revalidate_after)
+
+        with suppress(NotImplementedError, KeyError, OSError):
+            mtime = await self.fetcher.amtime(datasource.uri)
+            if mtime is not None:
+                cache.set_checked_mtime(cache_key, mtime)
+            return mtime
+        return None
+
+    def _get_chunks_with_cache(
+        self, datasource: "DataSource", cache: Cache
+    ) -> Generator[pd.DataFrame, None, None]:
+        """
+        Chunks of a datasource are cached one by one (under the `<key>_chunk_<index>` keys)
+        while they are read, then a last entry, under the datasource key, stores the number
+        of chunks once they have all been read.
+        Cached chunks are then lazily replayed one by one from the cache.
+        """
+        cache_key = datasource.hash
+        cache_mtime = self._get_cache_mtime(datasource, cache)
+
+        with suppress(KeyError):
+            chunks_infos = cache.get(key=cache_key, mtime=cache_mtime, expire=self.expire)
+            for i in range(int(chunks_infos["nb_chunks"].iloc[0])):
+                try:
+                    chunk = cache.get(key=f"{cache_key}_chunk_{i}", mtime=cache_mtime)
+                except KeyError:
+                    # the chunk is not in the cache anymore (e.g. evicted):
+                    # read the remaining ones from the datasource
+                    yield from islice(self._cache_chunks(datasource, cache, cache_mtime), i, None)
+                    return
+                yield chunk
+            return
+
+        yield from self._cache_chunks(datasource, cache, cache_mtime)
+
+    def _cache_chunks(
+        self, datasource: "DataSource", cache: Cache, cache_mtime: float | None
+    ) -> Generator[pd.DataFrame, None, None]:
+        cache_key = datasource.hash
+        nb_chunks = 0
+        started_at = perf_counter()
+        for chunk in self._read_dfs(datasource, cache, cache_mtime):
+            cost = perf_counter() - started_at
+            cache.set(
+                key=f"{cache_key}_chunk_{nb_chunks}", value=chunk, mtime=cache_mtime, cost=cost
+            )
+            nb_chunks += 1
+            yield chunk
+            started_at = perf_counter()
+        # only complete sequences of chunks can be replayed
+        chunks_infos = pd.DataFrame({"nb_chunks": [nb_chunks]})
+        cache.set(key=cache_key, value=chunks_infos, mtime=cache_mtime)
 
     def get_dfs(self, cache: Cache | None = None) -> Generator[pd.DataFrame, None, None]:
         """
@@ -135,40 +484,383 @@ class DataSource:
         with all the dataframes
         The generator can have a single dataframe (single file as input
         without options) or many (e.g. with `match` or `chunksize`)
+        With `max_workers`, the matched files are fetched and read concurrently (unless read
+        by chunk), their dataframes being still yielded in the order of the files.
         """
         by_chunk = self.reader_kwargs.get("chunksize") is not None
-        with_cache = cache is not None and self.expire and not by_chunk
-
-        for datasource in self.get_matched_datasources():
-            if with_cache:
-                cache_key = datasource.hash
-                cache_mtime = None
-                with suppress(NotImplementedError, KeyError, OSError):
-                    cache_mtime = self.fetcher.mtime(datasource.uri)
-
-                with suppress(KeyError):
-                    assert cache is not None
-                    df = cache.get(key=cache_key, mtime=cache_mtime, expire=self.expire)
-                    yield df
-                    continue
+        datasources = self.get_matched_datasources()
 
-            stream = self.fetcher.open(datasource.uri)
-            try:
-                df = self._get_single_df(stream, self.type, **self.reader_kwargs)
-                dfs = df if by_chunk else [df]
-            except pd.errors.EmptyDataError:
-                dfs = [pd.DataFrame()]
+        if self.match and not by_chunk and self.max_workers is not None and self.max_workers > 1:
+            for dfs in map_ordered(
+                lambda datasource: list(self._get_datasource_dfs(datasource, cache)),
+                datasources,
+                self.max_workers,
+            ):
+                yield from dfs
+            return
+
+        for datasource in datasources:
+            yield from self._get_datasource_dfs(datasource, cache)
+
+    def _get_datasource_dfs(
+        self, datasource: "DataSource", cache: Cache | None = None
+    ) -> Generator[pd.DataFrame, None, None]:
+        """Dataframes of a matched datasource, from the cache if possible"""
+        if cache is None or not self.expire:
+            yield from self._read_dfs(datasource)
+            return
+
+        if self.reader_kwargs.get("chunksize") is not None:
+            yield from self._get_chunks_with_cache(datasource, cache)
+            return
+
+        cache_mtime = self._get_cache_mtime(datasource, cache)
+        with suppress(KeyError):
+            yield self._get_cached_df(datasource, cache, cache_mtime)
+            return
+
+        yield from _single_flight.do(
+            (id(cache), datasource.hash),
+            lambda: list(self._read_and_cache_dfs(datasource, cache, cache_mtime)),
+            copy=lambda dfs: [safe_copy(df) for df in dfs],
+        )
 
+    def _get_cached_df(
+        self, datasource: "DataSource", cache: Cache, cache_mtime: float | None
+    ) -> pd.DataFrame:
+        """
+        Dataframe of a matched datasource from the cache: its (possibly stale) cached value
+        or a slice of its cached full dataframe. Raise a `KeyError` otherwise.
+        """
+        if self.max_stale is not None:
+            with suppress(KeyError):
+                return self._get_stale_while_revalidate(datasource, cache, cache_mtime)
+
+        with suppress(KeyError):
+            return cache.get(key=datasource.hash, mtime=cache_mtime, expire=self.expire)
+
+        return self._get_sliced_full_df(datasource, cache, cache_mtime)
+
+    async def aget_dfs(self, cache: Cache | None = None) -> AsyncGenerator[pd.DataFrame, None]:
+        """
+        Same as `get_dfs`, without blocking the event loop: the files are fetched with the
+        async methods of the fetcher and read in threads.
+        With `max_workers`, up to `max_workers` matched files are fetched and read concurrently.
+        """
+        datasources = await self.aget_matched_datasources()
+        if self.reader_kwargs.get("chunksize") is not None:
+            # chunks are yielded as soon as they are parsed, one file after the other
+            for datasource in datasources:
+                async for df in self._aget_datasource_chunks(datasource, cache):
+                    yield df
+            return
+
+        max_concurrency = max(self.max_workers or 1, 1)
+        async for dfs in amap_ordered(
+            lambda datasource: self._aget_datasource_dfs(datasource, cache),
+            datasources,
+            max_concurrency,
+        ):
             for df in dfs:
-                if self.match:
-                    df["__filename__"] = os.path.basename(datasource.uri)  # type:ignore[index]
-                if with_cache:
-                    assert cache is not None
-                    cache.set(key=cache_key, value=df, mtime=cache_mtime)
                 yield df
 
+    async def _aget_datasource_dfs(
+        self, datasource: "DataSource", cache: Cache | None = None
+    ) -> list[pd.DataFrame]:
+        if cache is None or not self.expire:
+            stream = await self.fetcher.aopen(datasource.uri)
+            return await asyncio.to_thread(lambda: list(self._read_dfs(datasource, stream=stream)))
+
+        cache_mtime = await self._aget_cache_mtime(datasource, cache)
+        with suppress(KeyError):
+            return [await asyncio.to_thread(self._get_cached_df, datasource, cache, cache_mtime)]
+
+        async def load() -> list[pd.DataFrame]:
+            stream = await self.fetcher.aopen(datasource.uri)
+            return await asyncio.to_thread(
+                lambda: list(self._read_and_cache_dfs(datasource, cache, cache_mtime, stream))
+            )
+
+        # concurrent loads of the same cold datasource are only done once
+        key = (id(asyncio.get_running_loop()), id(cache), datasource.hash)
+        if (task := _async_loads.get(key)) is None:
+            task = _async_loads[key] = asyncio.ensure_future(load())
+            task.add_done_callback(lambda _: _async_loads.pop(key, None))
+            return await asyncio.shield(task)
+        # the waiting callers get their own copies of the loaded dataframes
+        return [safe_copy(df) for df in await asyncio.shield(task)]
+
+    async def _aget_datasource_chunks(
+        self, datasource: "DataSource", cache: Cache | None = None
+    ) -> AsyncGenerator[pd.DataFrame, None]:
+        if cache is None or not self.expire:
+            stream = await self.fetcher.aopen(datasource.uri)
+            chunks = self._read_dfs(datasource, stream=stream)
+        else:
+            chunks = self._get_chunks_with_cache(datasource, cache)
+        async for chunk in aiterate(chunks):
+            yield chunk
+
+    def _get_sliced_full_df(
+        self, datasource: "DataSource", cache: Cache, cache_mtime: float | None
+    ) -> pd.DataFrame:
+        """
+        Get the dataframe by slicing the cached full dataframe of the same file (i.e. read
+        without the slicing reader kwargs like `preview_nrows` or `usecols`), if any.
+        Raise a `KeyError` if the full dataframe is not cached or cannot be sliced.
+        """
+        slicing = {k: v for k, v in self.reader_kwargs.items() if k in SLICING_READER_KWARGS}
+        if (
+            not slicing
+            or any(self.type not in SLICING_READER_KWARGS[k] for k in slicing)
+            or _UNSLICEABLE_READER_KWARGS & set(self.reader_kwargs)
+            # `nrows` is applied differently by each reader when combined with a preview
+            or ("nrows" in slicing and {"preview_offset", "preview_nrows"} & set(slicing))
+        ):
+            raise KeyError(datasource.hash)
+        columns: list[str] | None = slicing.get("usecols", slicing.get("columns"))
+        if columns is not None and not all(isinstance(c, str) for c in columns):
+            raise KeyError(datasource.hash)
+
+        full_reader_kwargs = {
+            k: v for k, v in self.reader_kwargs.items() if k not in SLICING_READER_KWARGS
+        }
+        full_datasource = DataSource(**{**asdict(datasource), "reader_kwargs": full_reader_kwargs})
+        full_datasource._detected_kwargs = datasource._detected_kwargs
+        df = cache.get(key=full_datasource.hash, mtime=cache_mtime, expire=self.expire)
+
+        if columns is not None:
+            if missing_columns := set(columns) - set(df.columns):
+                raise KeyError(missing_columns)
+            if "usecols" in slicing:  # `usecols` keeps the order of the file
+                columns = [c for c in df.columns if c in columns]
+            df = df[columns]
+        start = slicing.get("preview_offset") or 0
+        nrows = slicing.get("preview_nrows", slicing.get("nrows"))
+        df = df.iloc[start : None if nrows is None else start + nrows].reset_index(drop=True)
+        if self.match:
+            df["__filename__"] = os.path.basename(datasource.uri)
+        return df
+
+    def _read_and_cache_dfs(
+        self,
+        datasource: "DataSource",
+        cache: Cache,
+        cache_mtime: float | None,
+        stream: IO[bytes] | IO[str] | None = None,
+    ) -> Generator[pd.DataFrame, None, None]:
+        started_at = perf_counter()
+        for df in self._read_dfs(datasource, cache, cache_mtime, stream):
+            cost = perf_counter() - started_at
+            cache.set(key=datasource.hash, value=df, mtime=cache_mtime, cost=cost)
+            yield df
+
+    def _get_stale_while_revalidate(
+        self, datasource: "DataSource", cache: Cache, cache_mtime: float | None
+    ) -> pd.DataFrame:
+        """
+        Get a cached value, even if it expired less than `max_stale` ago.
+        In that case, the value is refreshed in a background thread.
+        Values invalidated by their mtime are never returned.
+        """
+        assert self.expire is not None and self.max_stale is not None
+        cache_key = datasource.hash
+        infos = cache.get_infos(cache_key)
+        df = cache.get(key=cache_key, mtime=cache_mtime, expire=self.expire + self.max_stale)
+        reason = cache.invalidation_reason(
+            cached_mtime=infos["mtime"],
+            expire=self.expire,
+            cached_created_at=infos["created_at"],
+        )
+        if reason is InvalidationReasonEnum.EXPIRE:
+            self._refresh_in_background(datasource, cache, cache_mtime)
+        return df
+
+    def _refresh_in_background(
+        self, datasource: "DataSource", cache: Cache, cache_mtime: float | None
+    ) -> None:
+        cache_key = datasource.hash
+        with _refreshing_lock:
+            if cache_key in _refreshing:
+                return  # already being refreshed
+            _refreshing.add(cache_key)
+
+        def refresh() -> None:
+            try:
+                deque(self._read_and_cache_dfs(datasource, cache, cache_mtime), maxlen=0)
+            except Exception:
+                logger.exception(f"Failed to refresh {datasource.uri!r} in background")
+            finally:
+                with _refreshing_lock:
+                    _refreshing.discard(cache_key)
+
+        Thread(target=refresh, name=f"peakina-refresh{cache_key}", daemon=True).start()
+
     def get_df(self, cache: Cache | None = None) -> pd.DataFrame:
-        return pd.concat([x for x in self.get_dfs(cache=cache)], sort=False).reset_index(drop=True)
+        if cache is not None and self.expire and self.match:
+            return self._get_concatenated_df_with_cache(cache)
+        return self._concat(self.get_dfs(cache=cache))
+
+    async def aget_df(self, cache: Cache | None = None) -> pd.DataFrame:
+        """Same as `get_df`, without blocking the event loop"""
+        if cache is not None and self.expire and self.match:
+            return await self._aget_concatenated_df_with_cache(cache)
+        dfs = [df async for df in self.aget_dfs(cache=cache)]
+        return await asyncio.to_thread(self._concat, dfs)
+
+    @staticmethod
+    def _concat(dfs: Iterable[pd.DataFrame]) -> pd.DataFrame:
+        parts = list(dfs)
+        if (df := _arrow_concat(parts)) is not None:
+            return df
+        return pd.concat(parts, sort=False).reset_index(drop=True)
+
+    def get_tables(self) -> Generator[pa.Table, None, None]:
+        """
+        Same as `get_dfs`, with Arrow tables. Files are read as such by the readers supporting
+        it (e.g. parquet or excel files), without being loaded in a dataframe.
+        """
+        datasources = self.get_matched_datasources()
+        if self.match and self.max_workers is not None and self.max_workers > 1:
+            for tables in map_ordered(
+                lambda datasource: list(self._read_tables(datasource)),
+                datasources,
+                self.max_workers,
+            ):
+                yield from tables
+            return
+
+        for datasource in datasources:
+            yield from self._read_tables(datasource)
+
+    def get_table(self) -> pa.Table:
+        """Same as `get_df`, with an Arrow table"""
+        tables = list(self.get_tables())
+        if not tables:
+            raise ValueError("No objects to concatenate")
+        return pa.concat_tables(tables, promote_options="permissive")
+
+    def _read_tables(self, datasource: "DataSource") -> Generator[pa.Table, None, None]:
+        """Fetch and read a (not matched) datasource, yielding its table or its chunks"""
+        stream = self.fetcher.open(datasource.uri)
+        try:
+            filetype = self.type or TypeEnum(detect_type(stream.name))
+            detected_kwargs = self._detect_kwargs(stream.name, filetype, self.reader_kwargs)
+            kwargs = {**self.reader_kwargs, **detected_kwargs}
+            tables: Iterable[pa.Table]
+            if kwargs.get("chunksize") is not None:
+                chunks = pd_read(stream.name, filetype, kwargs)
+                tables = (pa.Table.from_pandas(df, preserve_index=False) for df in chunks)
+            else:
+                tables = [arrow_read(stream.name, filetype, kwargs)]
+        except pd.errors.EmptyDataError:
+            tables = [pa.table({})]
+        finally:
+            stream.close()
+
+        for table in tables:
+            if self.match:
+                filename = os.path.basename(datasource.uri)
+                table = table.append_column("__filename__", pa.repeat(filename, table.num_rows))
+            yield table
+
+    @staticmethod
+    def _get_fingerprint(files_mtimes: list[tuple[str, float]]) -> float:
+        files_hash = md5(str(sorted(files_mtimes)).encode("utf-8")).hexdigest()
+        return float(int(files_hash[:12], 16))  # exactly representable as a float
+
+    def _get_concatenated_df_with_cache(self, cache: Cache) -> pd.DataFrame:
+        """
+        The concatenated dataframe of a matched datasource is cached as well, with the
+        fingerprint of the matched files and their mtime as mtime, so that it is reused as
+        long as no file has been added, removed or changed.
+        """
+        datasources = list(self.get_matched_datasources())
+        files_mtimes = []
+        for datasource in datasources:
+            if (mtime := self._get_cache_mtime(datasource, cache)) is None:
+                return self._concat(self.get_dfs(cache=cache))
+            files_mtimes.append((datasource.uri, mtime))
+        fingerprint = self._get_fingerprint(files_mtimes)
+
+        cache_key = f"{self.hash}__concat"
+        with suppress(KeyError):
+            return cache.get(key=cache_key, mtime=fingerprint, expire=self.expire)
+
+        parts_infos = self._get_parts_infos(datasources, cache)
+        df = self._concat(self.get_dfs(cache=cache))
+        if not self._has_expired_parts(parts_infos, cache):
+            cache.set(key=cache_key, value=df, mtime=fingerprint)
+        return df
+
+    async def _aget_concatenated_df_with_cache(self, cache: Cache) -> pd.DataFrame:
+        datasources = await self.aget_matched_datasources()
+        files_mtimes = []
+        for datasource in datasources:
+            if (mtime := await self._aget_cache_mtime(datasource, cache)) is None:
+                dfs = [df async for df in self.aget_dfs(cache=cache)]
+                return await asyncio.to_thread(self._concat, dfs)
+            files_mtimes.append((datasource.uri, mtime))
+        fingerprint = self._get_fingerprint(files_mtimes)
+
+        cache_key = f"{self.hash}__concat"
+        with suppress(KeyError):
+            return await asyncio.to_thread(
+                cache.get, key=cache_key, mtime=fingerprint, expire=self.expire
+            )
+
+        parts_infos = await asyncio.to_thread(self._get_parts_infos, datasources, cache)
+        dfs = [df async for df in self.aget_dfs(cache=cache)]
+        df = await asyncio.to_thread(self._concat, dfs)
+        if not self._has_expired_parts(parts_infos, cache):
+            await asyncio.to_thread(cache.set, key=cache_key, value=df, mtime=fingerprint)
+        return df
+
+    def _get_parts_infos(
+        self, datasources: list["DataSource"], cache: Cache
+    ) -> list[dict[str, Any]]:
+        """metadata of the cached values of the matched datasources (with `max_stale` only)"""
+        if self.max_stale is None:
+            return []
+        parts_infos = []
+        for datasource in datasources:
+            with suppress(KeyError):
+                parts_infos.append(cache.get_infos(datasource.hash))
+        return parts_infos
+
+    def _has_expired_parts(self, parts_infos: list[dict[str, Any]], cache: Cache) -> bool:
+        """
+        Whether some of the cached values read to build the concatenated dataframe have expired:
+        with `max_stale`, they are then served while being refreshed in background and the
+        concatenated dataframe must not be cached, as it would outlive them.
+        """
+        return any(
+            cache.invalidation_reason(
+                cached_mtime=infos["mtime"],
+                expire=self.expire,
+                cached_created_at=infos["created_at"],
+            )
+            for infos in parts_infos
+        )
+
+
+def read_arrow(
+    uri: str,
+    *,
+    type: TypeEnum | None = None,
+    match: MatchEnum | None = None,
+    fetcher_kwargs: dict[str, Any] | None = None,
+    max_workers: int | None = None,
+    **reader_kwargs: Any,
+) -> pa.Table:
+    return DataSource(
+        uri=uri,
+        type=type,
+        match=match,
+        fetcher_kwargs=fetcher_kwargs or {},
+        reader_kwargs=reader_kwargs,
+        max_workers=max_workers,
+    ).get_table()
 
 
 def read_pandas(
@@ -178,6 +870,8 @@ def read_pandas(
     match: MatchEnum | None = None,
     expire: timedelta | None = None,
     fetcher_kwargs: dict[str, Any] | None = None,
+    max_workers: int | None = None,
+    parse_in_processes: bool = False,
     **reader_kwargs: Any,
 ) -> pd.DataFrame:
     return DataSource(
@@ -187,4 +881,6 @@ def read_pandas(
         expire=expire,
         fetcher_kwargs=fetcher_kwargs or {},
         reader_kwargs=reader_kwargs,
+        max_workers=max_workers,
+        parse_in_processes=parse_in_processes,
     ).get_df()
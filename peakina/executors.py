@@ -0,0 +1,169 @@
+"""
+This module provides the executors used to fetch and read several files concurrently
+(e.g. the files of a matched datasource), in threads or in worker processes.
+"""
+
+import asyncio
+import multiprocessing
+import pickle
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Lock
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    TypeVar,
+    cast,
+)
+
+import pandas as pd
+import pyarrow as pa
+
+from peakina.helpers import pd_read
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_process_pool: ProcessPoolExecutor | None = None
+_process_pool_lock = Lock()
+
+
+def map_ordered(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+    *,
+    prefetch: int | None = None,
+) -> Generator[R, None, None]:
+    """
+    Lazily apply `func` on `items` in a pool of `max_workers` threads, yielding the results
+    in the order of `items`.
+    At most `prefetch` (by default twice `max_workers`) results are computed ahead of the
+    one being yielded, so that memory stays bounded when the consumer is slower.
+    Pending calls are cancelled if the generator is closed before its end.
+    """
+    prefetch = max(prefetch or 2 * max_workers, 1)
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="peakina-worker")
+    futures: deque[Future[R]] = deque()
+    try:
+        for item in items:
+            futures.append(executor.submit(func, item))
+            if len(futures) > prefetch:
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def amap_ordered(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    max_concurrency: int,
+) -> AsyncGenerator[R, None]:
+    """
+    Same as `map_ordered` with coroutines: at most `max_concurrency` calls of `func` run
+    concurrently in the event loop and their results are yielded in the order of `items`.
+    """
+    tasks: deque[asyncio.Task[R]] = deque()
+    try:
+        for item in items:
+            tasks.append(asyncio.ensure_future(func(item)))
+            if len(tasks) >= max_concurrency:
+                yield await tasks.popleft()
+        while tasks:
+            yield await tasks.popleft()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def aiterate(iterator: Iterator[T]) -> AsyncGenerator[T, None]:
+    """
+    Iterate over a blocking iterator without blocking the event loop: each item is computed
+    in a thread and yielded as soon as it is ready (e.g. the chunks of a file being parsed).
+    The iterator is closed if the async generator is closed before its end.
+    """
+    done = object()
+    try:
+        while (item := await asyncio.to_thread(next, iterator, done)) is not done:
+            yield cast(T, item)
+    finally:
+        if isinstance(iterator, Generator):
+            iterator.close()
+
+
+def get_process_pool(max_workers: int | None = None) -> ProcessPoolExecutor:
+    """
+    Process pool shared by all the datasources parsing their files in worker processes.
+    It is created by the first call (with `max_workers` processes, by default the number
+    of CPUs), with the `spawn` start method as the calling process may run threads.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(cancel_futures=True)
+            _process_pool = None
+
+
+def _pd_read_to_ipc(
+    filepath: str, t: str, kwargs: dict[str, Any]
+) -> tuple[bytes, dict[str, Any]] | pd.DataFrame:
+    """
+    Run in a worker process: read a file and serialize its dataframe in an Arrow IPC stream,
+    much faster to send back than a pickled dataframe.
+    Missing strings are converted back to None by Arrow: the missing value of the object columns
+    which have one (e.g. NaN) is sent along to be restored.
+    Dataframes which Arrow cannot represent (e.g. mixed types or geometries) are sent as is.
+    """
+    df = pd_read(filepath, t, kwargs)
+    if type(df) is not pd.DataFrame:
+        return df
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return df
+    null_values = {}
+    for column, dtype in df.dtypes.items():
+        if dtype.kind == "O" and table.column(str(column)).null_count:
+            null_values[str(column)] = df[column][df[column].isna()].iloc[0]
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes(), null_values
+
+
+def pd_read_in_process(filepath: str, t: str, kwargs: dict[str, Any]) -> pd.DataFrame:
+    """
+    Same as `pd_read`, but parsing the file in a worker process of the shared process pool.
+    Files whose reader kwargs can't be sent to another process (e.g. lambdas as `converters`)
+    are parsed in the calling process.
+    """
+    try:
+        pickle.dumps(kwargs)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return pd_read(filepath, t, kwargs)
+    result = get_process_pool().submit(_pd_read_to_ipc, filepath, t, kwargs).result()
+    if isinstance(result, pd.DataFrame):
+        return result
+    ipc_stream, null_values = result
+    df = pa.ipc.open_stream(ipc_stream).read_all().to_pandas()
+    for column, null_value in null_values.items():
+        if null_value is not None:
+            df[column] = df[column].where(df[column].notna(), null_value)
+    return df
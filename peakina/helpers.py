@@ -5,6 +5,7 @@ It's also where the reference of all supported types is done.
 In order to support a new type, you need to create a reader in the `readers`
 package and add the MIME types and the name of the method in `SUPPORTED_FILE_TYPES`
 The reader needs to take a filepath as first parameter and return a dataframe
+A reader returning an Arrow table can also be declared, if the file can be read without pandas
 """
 
 import csv
@@ -13,20 +14,25 @@ import mimetypes
 import os
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from itertools import islice
 from typing import Any, Callable, NamedTuple
 
 import chardet
 import pandas as pd
+import pyarrow as pa
 
 from peakina.readers import (
     csv_meta,
     excel_meta,
     read_csv,
     read_excel,
+    read_excel_table,
     read_geo_data,
+    read_geo_data_table,
     read_json,
     read_parquet,
+    read_parquet_table,
     read_xml,
 )
 
@@ -41,6 +47,9 @@ class TypeInfos(NamedTuple):
     # to declare them for `validate_kwargs` method
     reader_kwargs: list[str] = []
     metadata_reader: Callable[..., dict[str, Any]] | None = None
+    # The method to open a given type of file as an Arrow table, with the same parameters
+    # as `reader`. Without it, the dataframe returned by `reader` is converted.
+    arrow_reader: Callable[..., pa.Table] | None = None
 
 
 # For files without MIME types, we make fake MIME types based on detected extension
@@ -63,17 +72,19 @@ SUPPORTED_FILE_TYPES = {
         read_excel,
         [],
         excel_meta,
+        arrow_reader=read_excel_table,
     ),
     "geodata": TypeInfos(
         ["peakina/geo"],
         read_geo_data,
+        arrow_reader=read_geo_data_table,
     ),
     "json": TypeInfos(
         ["application/json"],
         read_json,
         ["filter"],  # this option comes from read_json, which @wraps(pd.read_json)
     ),
-    "parquet": TypeInfos(["peakina/parquet"], read_parquet),
+    "parquet": TypeInfos(["peakina/parquet"], read_parquet, arrow_reader=read_parquet_table),
     "xml": TypeInfos(["application/xml", "text/xml"], read_xml),
 }
 
@@ -174,6 +185,19 @@ def get_reader_allowed_params(t: TypeEnum) -> list[str]:
     return [kw for kw in inspect.signature(reader).parameters]
 
 
+@lru_cache
+def get_reader_defaults(t: TypeEnum) -> dict[str, Any]:
+    """Default values of the kwargs of a reader (including the ones of the reader it wraps)"""
+    reader = SUPPORTED_FILE_TYPES[t].reader
+    defaults: dict[str, Any] = {}
+    # the defaults of the reader itself override the ones of the wrapped reader
+    for signature in (inspect.signature(reader), inspect.signature(reader, follow_wrapped=False)):
+        for name, parameter in signature.parameters.items():
+            if parameter.default is not inspect.Parameter.empty:
+                defaults[name] = parameter.default
+    return defaults
+
+
 def validate_kwargs(kwargs: dict[str, Any], t: TypeEnum | None) -> bool:
     """
     Validate that kwargs are at least in one signature of the methods
@@ -201,6 +225,12 @@ def pd_read(filepath: str, t: str, kwargs: dict[str, Any]) -> pd.DataFrame:
     return SUPPORTED_FILE_TYPES[t].reader(filepath, **kwargs)
 
 
+def arrow_read(filepath: str, t: str, kwargs: dict[str, Any]) -> pa.Table:
+    if (arrow_reader := SUPPORTED_FILE_TYPES[t].arrow_reader) is not None:
+        return arrow_reader(filepath, **kwargs)
+    return pa.Table.from_pandas(pd_read(filepath, t, kwargs), preserve_index=False)
+
+
 def get_metadata(filepath: str, type: str, reader_kwargs: dict[str, Any]) -> dict[str, Any]:
     metadata_reader = SUPPORTED_FILE_TYPES[type].metadata_reader
     return metadata_reader(filepath, reader_kwargs) if metadata_reader else {}
@@ -1,3 +1,4 @@
+from .circuit_breaker import CircuitOpenError, configure_circuit_breaker
 from .fetcher import Fetcher, MatchEnum, fetch
 from .ftp.ftp_fetcher import FTPFetcher
 from .http.http_fetcher import HttpFetcher
@@ -5,6 +6,8 @@ from .local.file_fetcher import FileFetcher
 from .s3.s3_fetcher import S3Fetcher
 
 __all__ = (
+    "CircuitOpenError",
+    "configure_circuit_breaker",
     "Fetcher",
     "MatchEnum",
     "FTPFetcher",
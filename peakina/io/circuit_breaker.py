@@ -0,0 +1,205 @@
+"""
+This module provides a per-host circuit breaker shared by all the remote fetchers
+(ftp, s3, http...), as well as a short-lived negative cache of the urls that failed.
+
+Once `failure_threshold` consecutive fetches of the same host have failed, the circuit
+of this host is open: the fetches of this host fail fast with a `CircuitOpenError`
+instead of going through the (possibly long) retries of the fetcher.
+After `reset_timeout` seconds, a single fetch is let through to probe the host: if it
+succeeds, the circuit is closed again, otherwise it stays open for another `reset_timeout`.
+
+Independently, a url whose fetch failed fails fast for `negative_ttl` seconds.
+"""
+
+import ftplib
+import logging
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from hashlib import sha256
+from time import monotonic
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# errors related to the requested file and not to the availability of its host:
+# they are only cached negatively and do not open the circuit of the host
+FILE_ERRORS: tuple[type[Exception], ...] = (
+    FileNotFoundError,
+    IsADirectoryError,
+    NotADirectoryError,
+    PermissionError,
+    ftplib.error_perm,
+)
+
+
+def _is_file_error(error: BaseException) -> bool:
+    """Whether an error, or one of the errors it was raised from, is a file error"""
+    cause: BaseException | None = error
+    while cause is not None:
+        if isinstance(cause, FILE_ERRORS):
+            return True
+        cause = cause.__cause__
+    return False
+
+
+class CircuitOpenError(OSError):
+    """Raised instead of fetching a url whose host is down or which failed recently"""
+
+
+class CircuitStateEnum(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class _HostState:
+    failures: int = 0
+    opened_at: float | None = None
+    probing: bool = False
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int | None = 3,
+        reset_timeout: float = 60,
+        negative_ttl: float = 30,
+    ) -> None:
+        """
+        `failure_threshold` set to None disables the circuit breaker
+        and `negative_ttl` set to 0 disables the negative cache.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.negative_ttl = negative_ttl
+        self._hosts: dict[str, _HostState] = {}
+        self._failed_urls: dict[str, tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_host(url: str) -> str:
+        """Scheme, hostname and port of a url, without its credentials"""
+        parsed = urlparse(url)
+        port = f":{parsed.port}" if parsed.port else ""
+        return f"{parsed.scheme}://{parsed.hostname or ''}{port}"
+
+    @classmethod
+    def redact(cls, url: str) -> str:
+        """Url without its credentials nor its query (which may contain a token), for messages"""
+        return f"{cls.get_host(url)}{urlparse(url).path}"
+
+    @staticmethod
+    def _url_key(url: str) -> str:
+        """Key of a url in the negative cache: a hash of the full url, not kept in clear"""
+        return sha256(url.encode("utf-8")).hexdigest()
+
+    def state(self, url: str) -> CircuitStateEnum:
+        with self._lock:
+            host_state = self._hosts.get(self.get_host(url))
+            if host_state is None or host_state.opened_at is None:
+                return CircuitStateEnum.CLOSED
+            if host_state.probing or monotonic() - host_state.opened_at >= self.reset_timeout:
+                return CircuitStateEnum.HALF_OPEN
+            return CircuitStateEnum.OPEN
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hosts.clear()
+            self._failed_urls.clear()
+
+    def _before_call(self, url: str, host: str) -> bool:
+        """
+        Raises a `CircuitOpenError` if the call must fail fast.
+        Returns whether the call is the probe of a half-open circuit.
+        """
+        now = monotonic()
+        url_key = self._url_key(url)
+        with self._lock:
+            if (failed := self._failed_urls.get(url_key)) is not None:
+                expires_at, error = failed
+                if now < expires_at:
+                    raise CircuitOpenError(
+                        f"Fetching {self.redact(url)!r} failed recently: {error}"
+                    )
+                del self._failed_urls[url_key]
+
+            host_state = self._hosts.get(host)
+            if host_state is None or host_state.opened_at is None:
+                return False
+            if host_state.probing or now - host_state.opened_at < self.reset_timeout:
+                raise CircuitOpenError(f"Circuit of {host!r} is open after repeated failures")
+            host_state.probing = True
+            return True
+
+    def _on_success(self, host: str) -> None:
+        with self._lock:
+            if (host_state := self._hosts.pop(host, None)) and host_state.opened_at is not None:
+                logger.info(f"Circuit of {host!r} is closed")
+
+    def _on_interruption(self, host: str, probe: bool) -> None:
+        """The call was interrupted (e.g. cancelled): let another call probe the host"""
+        if probe:
+            with self._lock:
+                if (host_state := self._hosts.get(host)) is not None:
+                    host_state.probing = False
+
+    def _on_failure(self, url: str, host: str, error: Exception, probe: bool) -> None:
+        now = monotonic()
+        with self._lock:
+            if self.negative_ttl > 0:
+                self._failed_urls = {
+                    u: failed for u, failed in self._failed_urls.items() if failed[0] > now
+                }
+                self._failed_urls[self._url_key(url)] = (now + self.negative_ttl, repr(error))
+
+            if _is_file_error(error):
+                # the host did answer
+                if probe:
+                    self._hosts.pop(host, None)
+                return
+
+            host_state = self._hosts.setdefault(host, _HostState())
+            host_state.failures += 1
+            host_state.probing = False
+            if probe or (
+                self.failure_threshold is not None and host_state.failures >= self.failure_threshold
+            ):
+                if host_state.opened_at is None:
+                    logger.warning(f"Circuit of {host!r} is open after {error!r}")
+                host_state.opened_at = now
+
+    @contextmanager
+    def guard(self, url: str) -> Iterator[None]:
+        """Context manager wrapping a call fetching `url`"""
+        host = self.get_host(url)
+        probe = self._before_call(url, host)
+        try:
+            yield
+        except Exception as e:
+            self._on_failure(url, host, e, probe)
+            raise
+        except BaseException:
+            self._on_interruption(host, probe)
+            raise
+        else:
+            self._on_success(host)
+
+
+circuit_breaker = CircuitBreaker()
+
+
+def configure_circuit_breaker(
+    *,
+    failure_threshold: int | None = 3,
+    reset_timeout: float = 60,
+    negative_ttl: float = 30,
+) -> None:
+    """Configure the circuit breaker shared by all the fetchers, resetting its state"""
+    circuit_breaker.failure_threshold = failure_threshold
+    circuit_breaker.reset_timeout = reset_timeout
+    circuit_breaker.negative_ttl = negative_ttl
+    circuit_breaker.reset()
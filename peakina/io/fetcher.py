@@ -6,6 +6,7 @@ filepath by calling the right registered subclass (local, ftp...) matching the f
 The subclasses are all declared in the `io` directory.
 """
 
+import asyncio
 import fnmatch
 import os
 import re
@@ -45,6 +46,8 @@ class Fetcher(metaclass=ABCMeta):
     This class is used by calling `get_fetcher`, which reads the scheme of the path
     ('ftp', 's3', ...) and redirects to the right fetcher.
     All the `Fetcher` subclasses need to implement basic methods in order to be used properly.
+    Their async counterparts (`aopen`, `amtime`...) run them in a thread by default and can be
+    overridden by the fetchers having a native asynchronous implementation.
     """
 
     registry: dict[str, type["Fetcher"]] = {}
@@ -69,6 +72,15 @@ class Fetcher(metaclass=ABCMeta):
     def mtime(self, filepath: str) -> int | None:
         """Get last modification time of a file"""
 
+    async def alistdir(self, dirpath: str) -> list[str]:
+        return await asyncio.to_thread(self.listdir, dirpath)
+
+    async def aopen(self, filepath: str) -> IO[bytes] | IO[str]:
+        return await asyncio.to_thread(self.open, filepath)
+
+    async def amtime(self, filepath: str) -> int | None:
+        return await asyncio.to_thread(self.mtime, filepath)
+
     @staticmethod
     def is_matching(filename: str, match: MatchEnum | None, pattern: Pattern[str]) -> bool:
         if match is None:
@@ -83,9 +95,21 @@ class Fetcher(metaclass=ABCMeta):
         if match is None:
             return [filepath]
 
+        dirpath = os.path.dirname(filepath)
+        return self._match_filenames(filepath, match, self.listdir(dirpath))
+
+    async def aget_filepath_list(self, filepath: str, match: MatchEnum | None = None) -> list[str]:
+        if match is None:
+            return [filepath]
+
+        dirpath = os.path.dirname(filepath)
+        return self._match_filenames(filepath, match, await self.alistdir(dirpath))
+
+    def _match_filenames(
+        self, filepath: str, match: MatchEnum, all_filenames: list[str]
+    ) -> list[str]:
         dirpath, basename = os.path.split(filepath)
         pattern = re.compile(basename)
-        all_filenames = self.listdir(dirpath)
         matching_filenames = [f for f in all_filenames if self.is_matching(f, match, pattern)]
         return [os.path.join(dirpath, f) for f in sorted(matching_filenames)]
 
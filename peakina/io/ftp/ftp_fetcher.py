@@ -3,8 +3,9 @@ from typing import IO, Any
 
 from peakina.cache import timed_lru_cache
 
+from ..circuit_breaker import circuit_breaker
 from ..fetcher import Fetcher, register
-from .ftp_utils import FTP_SCHEMES, dir_mtimes, ftp_mtime, ftp_open
+from .ftp_utils import FTP_SCHEMES, aftp_open, dir_mtimes, ftp_mtime, ftp_open
 
 
 @timed_lru_cache(maxsize=3, seconds=60)
@@ -25,11 +26,17 @@ class FTPFetcher(Fetcher):
 
     def get_dir_mtimes(self, dirpath: str) -> dict[str, int | None]:
         if dirpath not in self._mtimes_cache:
-            self._mtimes_cache[dirpath] = dir_mtimes(dirpath)
+            with circuit_breaker.guard(dirpath):
+                self._mtimes_cache[dirpath] = dir_mtimes(dirpath)
         return self._mtimes_cache[dirpath]
 
     def open(self, filepath: str) -> IO[bytes]:
-        return ftp_open(filepath)
+        with circuit_breaker.guard(filepath):
+            return ftp_open(filepath)
+
+    async def aopen(self, filepath: str) -> IO[bytes]:
+        with circuit_breaker.guard(filepath):
+            return await aftp_open(filepath)
 
     def listdir(self, dirpath: str) -> list[str]:
         """
@@ -45,4 +52,5 @@ class FTPFetcher(Fetcher):
         if dirpath in self._mtimes_cache:
             return self._mtimes_cache[dirpath][filename]
         else:
-            return ftp_mtime(filepath)
+            with circuit_breaker.guard(filepath):
+                return ftp_mtime(filepath)
@@ -1,3 +1,4 @@
+import asyncio
 import ftplib
 import logging
 import os
@@ -187,24 +188,44 @@ def _open(url: str) -> IO[bytes]:
     return ret
 
 
+_RETRIED_OPEN_ERRORS = (AttributeError, OSError, ftplib.error_temp, paramiko.SSHException)
+
+
+def _get_retry_sleep_time(url: str, i: int, e: Exception) -> int:
+    log = logging.getLogger(__name__)
+
+    # FileNotFoundError inherits from OSError
+    # We need to log that we're not seeing the specified file
+    if isinstance(e, FileNotFoundError):  # pragma: no cover
+        log.warning(
+            f"File '{os.path.basename(url)}' not available inside : "
+            f"'{os.path.dirname(urlparse(url).path)}' !"
+        )
+
+    sleep_time = 2 * i**2
+    log.warning(f"Retry #{i}: Sleeping {sleep_time}s because {e}")
+    return sleep_time
+
+
 def ftp_open(url: str, retry: int = _DEFAULT_MAX_RETRY) -> IO[bytes]:  # type: ignore
     for i in range(1, retry + 1):
         try:
             return _open(url)
-        except (AttributeError, OSError, ftplib.error_temp, paramiko.SSHException) as e:
-            log = logging.getLogger(__name__)
-
-            # FileNotFoundError inherits from OSError
-            # We need to log that we're not seeing the specified file
-            if isinstance(e, FileNotFoundError):  # pragma: no cover
-                log.warning(
-                    f"File '{os.path.basename(url)}' not available inside : "
-                    f"'{os.path.dirname(urlparse(url).path)}' !"
-                )
-
-            sleep_time = 2 * i**2
-            logging.getLogger(__name__).warning(f"Retry #{i}: Sleeping {sleep_time}s because {e}")
-            sleep(sleep_time)
+        except _RETRIED_OPEN_ERRORS as e:
+            if i == retry:
+                raise
+            sleep(_get_retry_sleep_time(url, i, e))
+
+
+async def aftp_open(url: str, retry: int = _DEFAULT_MAX_RETRY) -> IO[bytes]:  # type: ignore
+    """Same as `ftp_open`, without blocking the event loop while connecting or retrying"""
+    for i in range(1, retry + 1):
+        try:
+            return await asyncio.to_thread(_open, url)
+        except _RETRIED_OPEN_ERRORS as e:
+            if i == retry:
+                raise
+            await asyncio.sleep(_get_retry_sleep_time(url, i, e))
 
 
 def _get_all_files(c: FTPClient, path: str) -> list[str]:
@@ -5,6 +5,7 @@ from typing import IO, Any
 import certifi
 import urllib3
 
+from ..circuit_breaker import circuit_breaker
 from ..fetcher import Fetcher, register
 
 
@@ -21,10 +22,13 @@ class HttpFetcher(Fetcher):
             self.pool_manager = urllib3.PoolManager(cert_reqs="CERT_NONE", assert_hostname=False)
 
     def open(self, filepath: str) -> IO[bytes]:
-        r = self.pool_manager.request("GET", filepath, preload_content=False, **self.extra_kwargs)
-        ret = tempfile.NamedTemporaryFile(suffix=".httptmp")
-        for chunk in r.stream():
-            ret.write(chunk)
+        with circuit_breaker.guard(filepath):
+            r = self.pool_manager.request(
+                "GET", filepath, preload_content=False, **self.extra_kwargs
+            )
+            ret = tempfile.NamedTemporaryFile(suffix=".httptmp")
+            for chunk in r.stream():
+                ret.write(chunk)
         ret.seek(0)
         return ret
 
@@ -33,7 +37,8 @@ class HttpFetcher(Fetcher):
 
     def mtime(self, filepath: str) -> int | None:
         try:
-            r = self.pool_manager.request("HEAD", filepath)
+            with circuit_breaker.guard(filepath):
+                r = self.pool_manager.request("HEAD", filepath)
         except Exception:
             return None
         else:
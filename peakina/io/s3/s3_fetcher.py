@@ -1,8 +1,9 @@
 import os
 from typing import IO, Any
 
+from ..circuit_breaker import circuit_breaker
 from ..fetcher import Fetcher, register
-from .s3_utils import S3_SCHEMES, dir_mtimes, s3_mtime, s3_open
+from .s3_utils import S3_SCHEMES, as3_mtime, as3_open, dir_mtimes, s3_mtime, s3_open
 
 
 @register(schemes=S3_SCHEMES)
@@ -14,11 +15,17 @@ class S3Fetcher(Fetcher):
 
     def get_dir_mtimes(self, dirpath: str) -> dict[str, int | None]:
         if dirpath not in self._mtimes_cache:
-            self._mtimes_cache[dirpath] = dir_mtimes(dirpath, client_kwargs=self.client_kwargs)
+            with circuit_breaker.guard(dirpath):
+                self._mtimes_cache[dirpath] = dir_mtimes(dirpath, client_kwargs=self.client_kwargs)
         return self._mtimes_cache[dirpath]
 
     def open(self, filepath: str) -> IO[bytes]:
-        return s3_open(filepath, client_kwargs=self.client_kwargs)
+        with circuit_breaker.guard(filepath):
+            return s3_open(filepath, client_kwargs=self.client_kwargs)
+
+    async def aopen(self, filepath: str) -> IO[bytes]:
+        with circuit_breaker.guard(filepath):
+            return await as3_open(filepath, client_kwargs=self.client_kwargs)
 
     def listdir(self, dirpath: str) -> list[str]:
         return list(self.get_dir_mtimes(dirpath).keys())
@@ -28,4 +35,13 @@ class S3Fetcher(Fetcher):
         if dirpath in self._mtimes_cache:
             return self._mtimes_cache[dirpath][filename]
         else:
-            return s3_mtime(filepath, client_kwargs=self.client_kwargs)
+            with circuit_breaker.guard(filepath):
+                return s3_mtime(filepath, client_kwargs=self.client_kwargs)
+
+    async def amtime(self, filepath: str) -> int | None:
+        dirpath, filename = os.path.split(filepath)
+        if dirpath in self._mtimes_cache:
+            return self._mtimes_cache[dirpath][filename]
+        else:
+            with circuit_breaker.guard(filepath):
+                return await as3_mtime(filepath, client_kwargs=self.client_kwargs)
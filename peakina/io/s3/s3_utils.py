@@ -1,5 +1,6 @@
 """This module gathers misc convenience functions to handle s3 objects"""
 
+import asyncio
 import logging
 import re
 import tempfile
@@ -91,6 +92,49 @@ def s3_open(url: str, *, client_kwargs: dict[str, Any] | None = None) -> IO[byte
     return ret
 
 
+async def _as3_cat_file_with_retries(fs: s3fs.S3FileSystem, path: str, retries: int) -> bytes:
+    """Same as `_s3_open_file_with_retries`, without blocking the event loop"""
+    nb_tries = 0
+    while True:
+        try:
+            return cast(bytes, await fs._cat_file(path))
+        except Exception as ex:
+            nb_tries += 1
+            if nb_tries >= retries:
+                raise Exception(f"Could not open {path} ({nb_tries} tries): {ex}") from ex
+            fs.invalidate_cache(path)
+            await asyncio.sleep(1)
+
+
+async def as3_open(url: str, *, client_kwargs: dict[str, Any] | None = None) -> IO[bytes]:
+    """Same as `s3_open`, using the asynchronous mode of s3fs"""
+    access_key, secret, bucketname, objectname = parse_s3_url(url)
+
+    token = None
+    if client_kwargs is not None and "session_token" in client_kwargs:
+        token = client_kwargs["session_token"]
+        client_kwargs = {k: v for k, v in client_kwargs.items() if k != "session_token"} or None
+
+    fs = s3fs.S3FileSystem(
+        key=access_key,
+        secret=secret,
+        client_kwargs=client_kwargs,
+        token=token,
+        asynchronous=True,
+        skip_instance_cache=True,
+    )
+    session = await fs.set_session()
+    try:
+        content = await _as3_cat_file_with_retries(fs, f"{bucketname}/{objectname}", 3)
+    finally:
+        await session.close()
+
+    ret = tempfile.NamedTemporaryFile(suffix=".s3tmp")
+    await asyncio.to_thread(ret.write, content)
+    ret.seek(0)
+    return ret
+
+
 def _get_timestamp(obj: dict[str, Any]) -> int | None:
     try:
         return cast(int, obj["LastModified"].timestamp())
@@ -104,6 +148,23 @@ def s3_mtime(url: str, *, client_kwargs: dict[str, Any] | None = None) -> int |
     return _get_timestamp(fs.info(f"{bucketname}/{objectname}"))
 
 
+async def as3_mtime(url: str, *, client_kwargs: dict[str, Any] | None = None) -> int | None:
+    """Same as `s3_mtime`, using the asynchronous mode of s3fs"""
+    access_key, secret, bucketname, objectname = parse_s3_url(url, file=True)
+    fs = s3fs.S3FileSystem(
+        key=access_key,
+        secret=secret,
+        client_kwargs=client_kwargs,
+        asynchronous=True,
+        skip_instance_cache=True,
+    )
+    session = await fs.set_session()
+    try:
+        return _get_timestamp(await fs._info(f"{bucketname}/{objectname}"))
+    finally:
+        await session.close()
+
+
 def dir_mtimes(
     dirpath: str, *, client_kwargs: dict[str, Any] | None = None
 ) -> dict[str, int | None]:
@@ -1,8 +1,8 @@
 from .csv import csv_meta, read_csv
-from .excel import excel_meta, read_excel
-from .geodata import read_geo_data
+from .excel import excel_meta, read_excel, read_excel_table
+from .geodata import read_geo_data, read_geo_data_table
 from .json import read_json
-from .parquet import read_parquet
+from .parquet import read_parquet, read_parquet_table
 from .xml import read_xml
 
 __all__ = (
@@ -11,6 +11,7 @@ __all__ = (
     "csv_meta",
     # EXCEL
     "read_excel",
+    "read_excel_table",
     "excel_meta",
     # JSON
     "read_json",
@@ -18,6 +19,8 @@ __all__ = (
     "read_xml",
     # GEOJSON
     "read_geo_data",
+    "read_geo_data_table",
     # PARQUET
     "read_parquet",
+    "read_parquet_table",
 )
@@ -8,6 +8,7 @@ from typing import Any
 
 import fastexcel as fe
 import pandas as pd
+import pyarrow as pa
 
 LOGGER = logging.getLogger(__name__)
 
@@ -47,19 +48,31 @@ def _rename_unnamed_columns_to_pandas(df: pd.DataFrame) -> pd.DataFrame:
     """
     to_rename = {}
     for column in df.columns:
-        match = _FE_COLUMN_REGEX.match(column)
-        if match:
-            to_rename[column] = f"Unnamed: {match.group(1)}"
+        if (renamed := _to_pandas_column_name(column)) != column:
+            to_rename[column] = renamed
     df.rename(to_rename, inplace=True, axis="columns")
     return df
 
 
-def read_excel(
-    path_or_data: Any,
-    preview_nrows: int | None = None,
-    preview_offset: int = 0,
-    **kwargs: Any,
-) -> pd.DataFrame:
+def _rename_unnamed_columns_of_table(table: pa.Table) -> pa.Table:
+    """Same as `_rename_unnamed_columns_to_pandas` for an Arrow table"""
+    return table.rename_columns([_to_pandas_column_name(c) for c in table.column_names])
+
+
+def _to_pandas_column_name(column: str) -> str:
+    match = _FE_COLUMN_REGEX.match(column)
+    return f"Unnamed: {match.group(1)}" if match else column
+
+
+def _slice_table(table: pa.Table, start: int | None = None, stop: int | None = None) -> pa.Table:
+    """Slice the rows of an Arrow table like `df.iloc[start:stop]`"""
+    rows = range(table.num_rows)[start:stop]
+    return table.slice(rows.start, len(rows))
+
+
+def _load_sheet(
+    path_or_data: Any, preview_nrows: int | None, preview_offset: int, kwargs: dict[str, Any]
+) -> fe.ExcelSheet:
     # Adapting pandas kwargs to fastexcel kwargs
     # By default, pandas.read_excel will only read the first sheet.
     sheet_id: str | int = (
@@ -79,7 +92,7 @@ def read_excel(
 
     excel_file = fe.read_excel(path_or_data)
 
-    sheet = excel_file.load_sheet(
+    return excel_file.load_sheet(
         sheet_id,
         header_row=skip_rows,
         n_rows=n_rows,
@@ -87,7 +100,15 @@ def read_excel(
         skip_whitespace_tail_rows=True,
         whitespace_as_null=True,
     )
-    df = sheet.to_pandas()
+
+
+def read_excel(
+    path_or_data: Any,
+    preview_nrows: int | None = None,
+    preview_offset: int = 0,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    df = _load_sheet(path_or_data, preview_nrows, preview_offset, kwargs).to_pandas()
     if preview_offset:
         df = df.iloc[preview_offset:]
     if preview_nrows:
@@ -98,6 +119,25 @@ def read_excel(
     return _rename_unnamed_columns_to_pandas(df)
 
 
+def read_excel_table(
+    path_or_data: Any,
+    preview_nrows: int | None = None,
+    preview_offset: int = 0,
+    **kwargs: Any,
+) -> pa.Table:
+    """Same as `read_excel`, returning the Arrow table produced by fastexcel"""
+    batch = _load_sheet(path_or_data, preview_nrows, preview_offset, kwargs).to_arrow()
+    table = pa.Table.from_batches([batch])
+    if preview_offset:
+        table = _slice_table(table, preview_offset)
+    if preview_nrows:
+        table = _slice_table(table, None, preview_nrows)
+    if (skip_footer := kwargs.get("skipfooter")) is not None:
+        table = _slice_table(table, None, -skip_footer)
+
+    return _rename_unnamed_columns_of_table(table)
+
+
 def excel_meta(filepath: str, reader_kwargs: dict[str, Any]) -> dict[str, Any]:
     """Returns a dictionary with the meta information of the Excel file."""
     excel_file = fe.read_excel(filepath)
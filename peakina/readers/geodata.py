@@ -2,6 +2,7 @@ from functools import wraps
 from typing import Any
 
 import geopandas as gpd
+import pyarrow as pa
 
 
 @wraps(gpd.read_file)
@@ -16,3 +17,11 @@ def read_geo_data(
         )
     gdf.geometry = gdf.geometry.make_valid()
     return gdf
+
+
+def read_geo_data_table(
+    path: str, preview_offset: int = 0, preview_nrows: int | None = None, **kwargs: Any
+) -> pa.Table:
+    """Same as `read_geo_data`, returning an Arrow table with the geometries encoded as WKB"""
+    gdf = read_geo_data(path, preview_offset=preview_offset, preview_nrows=preview_nrows, **kwargs)
+    return pa.table(gdf.to_arrow(index=False))
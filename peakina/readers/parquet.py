@@ -5,6 +5,7 @@ Module to enhance pandas.read_json with JQ filter
 from typing import TYPE_CHECKING, Any
 
 import pandas as pd
+import pyarrow as pa
 import pyarrow.dataset as ds
 
 if TYPE_CHECKING:
@@ -17,9 +18,22 @@ def read_parquet(
     path_or_buf: "FilePathOrBuffer",
     preview_offset: int = 0,
     preview_nrows: int | None = None,
-    columns: list[int] | None = None,
+    columns: list[str] | None = None,
     **kwargs: Any,
 ) -> pd.DataFrame:
+    return read_parquet_table(
+        path_or_buf, preview_offset=preview_offset, preview_nrows=preview_nrows, columns=columns
+    ).to_pandas()
+
+
+def read_parquet_table(
+    path_or_buf: "FilePathOrBuffer",
+    preview_offset: int = 0,
+    preview_nrows: int | None = None,
+    columns: list[str] | None = None,
+    **kwargs: Any,
+) -> pa.Table:
+    """Same as `read_parquet`, returning the Arrow table read from the file"""
     dataset = ds.dataset(source=path_or_buf, format="parquet")
     indices = None
 
@@ -33,4 +47,4 @@ def read_parquet(
     else:
         table = dataset.to_table(columns=columns)
 
-    return table.to_pandas()
+    return table
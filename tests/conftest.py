@@ -12,9 +12,16 @@ from docker.tls import TLSConfig
 from slugify import slugify
 from yaml import Loader
 
+from peakina.io.circuit_breaker import circuit_breaker
+
 fixtures_dir = f"{os.path.dirname(__file__)}/fixtures"
 
 
+@pytest.fixture(autouse=True)
+def reset_circuit_breaker():
+    circuit_breaker.reset()
+
+
 @pytest.fixture(scope="module")
 def path():
     def f(filename):
@@ -1,3 +1,4 @@
+import asyncio
 import ftplib
 import os
 import socket
@@ -10,6 +11,7 @@ from pytest_mock import MockFixture
 
 from peakina.io.ftp.ftp_utils import (
     _DEFAULT_MAX_TIMEOUT_SECONDS,
+    aftp_open,
     dir_mtimes,
     ftp_listdir,
     ftp_mtime,
@@ -213,3 +215,26 @@ def test_sftp_client_silent_close(mocker: MockFixture) -> None:
         # So, the test will pass if no exception propagates beyond this point
 
         assert sftp.get_channel()
+
+
+def test_retry_open_failure(mocker):
+    mocker.patch("peakina.io.ftp.ftp_utils._open").side_effect = OSError("Host is down")
+    mock_sleep = mocker.patch("peakina.io.ftp.ftp_utils.sleep")
+
+    with raises(OSError, match="Host is down"):
+        ftp_open(url="foo", retry=3)
+    assert mock_sleep.call_count == 2
+
+
+def test_aretry_open(mocker):
+    mocker.patch("peakina.io.ftp.ftp_utils._open").side_effect = [
+        ftplib.error_temp("421 Could not create socket"),
+        OSError("Random OSError"),
+        "ok",
+    ]
+    mock_sleep = mocker.patch("peakina.io.ftp.ftp_utils.asyncio.sleep")
+    blocking_sleep = mocker.patch("peakina.io.ftp.ftp_utils.sleep")
+
+    assert asyncio.run(aftp_open(url="foo")) == "ok"  # type: ignore[comparison-overlap]
+    mock_sleep.assert_has_calls([mocker.call(2), mocker.call(8)])
+    blocking_sleep.assert_not_called()
@@ -1,3 +1,4 @@
+import asyncio
 import re
 
 from peakina.io.fetcher import MatchEnum
@@ -32,3 +33,12 @@ def test_file_fetcher_match(path):
     assert fetcher.is_matching(
         filename, match=MatchEnum.REGEX, pattern=re.compile(r"2020 Report \(6\).xlsx")
     )
+
+
+def test_file_fetcher_async(path):
+    """It should run the blocking methods in a thread by default"""
+    fetcher = FileFetcher()
+    assert asyncio.run(fetcher.aopen(path("0_0.csv"))).read() == "a,b\n0,0\n0,1"
+    assert asyncio.run(fetcher.amtime(path("0_0.csv"))) == fetcher.mtime(path("0_0.csv"))
+    filepaths = asyncio.run(fetcher.aget_filepath_list(path("0_*.csv"), MatchEnum.GLOB))
+    assert filepaths == fetcher.get_filepath_list(path("0_*.csv"), MatchEnum.GLOB)
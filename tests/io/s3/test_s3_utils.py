@@ -1,11 +1,13 @@
+import asyncio
 import io
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from pytest import raises
 from pytest_mock import MockerFixture
 
 from peakina.io.s3.s3_utils import (
     _s3_open_file_with_retries,
+    as3_open,
     parse_s3_url as pu,
     s3_open,
 )
@@ -113,3 +115,30 @@ def test__s3_open_file_with_retries(mocker: MagicMock) -> None:
         _s3_open_file_with_retries(fs=s3fs_mock, path=path, retries=3)
 
     assert _s3_open_file_with_retries(fs=s3fs_mock, path=path, retries=4) == 42
+
+
+def test_as3_open(mocker: MockerFixture) -> None:
+    s3fs_file_system = mocker.patch("s3fs.S3FileSystem")
+    fs_mock = s3fs_file_system.return_value
+    session = AsyncMock()
+    fs_mock.set_session = AsyncMock(return_value=session)
+    fs_mock._cat_file = AsyncMock(side_effect=[Exception("Not visible yet"), b"a,b\n0,1\n"])
+    mock_sleep = mocker.patch("peakina.io.s3.s3_utils.asyncio.sleep")
+
+    tmpfile = asyncio.run(
+        as3_open("s3://my_key:my_secret@mybucket/file.csv", client_kwargs={"session_token": "xx"})
+    )
+    assert tmpfile.name.endswith(".s3tmp")
+    assert tmpfile.read() == b"a,b\n0,1\n"
+    s3fs_file_system.assert_called_once_with(
+        key="my_key",
+        secret="my_secret",
+        client_kwargs=None,
+        token="xx",
+        asynchronous=True,
+        skip_instance_cache=True,
+    )
+    fs_mock._cat_file.assert_called_with("mybucket/file.csv")
+    fs_mock.invalidate_cache.assert_called_once_with("mybucket/file.csv")
+    mock_sleep.assert_called_once_with(1)
+    session.close.assert_awaited_once()
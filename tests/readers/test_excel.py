@@ -1,6 +1,9 @@
 import pandas as pd
+import pyarrow as pa
+import pytest
 
 from peakina import DataSource
+from peakina.readers import read_excel, read_excel_table
 
 
 def test_simple_xls(path):
@@ -262,3 +265,23 @@ def test_excel_meta_with_broken_max_row(path):
     """
     ds = DataSource(path("formula_excel.xlsx"))
     assert ds.get_metadata() == {"sheetnames": ["Sheet1"]}
+
+
+@pytest.mark.parametrize(
+    "reader_kwargs",
+    [
+        {},
+        {"preview_nrows": 2},
+        {"preview_nrows": 3, "preview_offset": 2},
+        {"skipfooter": 2},
+        {"sheet_name": "January", "nrows": 1},
+    ],
+)
+def test_read_excel_table(path, reader_kwargs):
+    """It should read excel files as Arrow tables, like `read_excel`"""
+    filename = "fixture-multi-sheet.xlsx" if "sheet_name" in reader_kwargs else "fixture.xls"
+    filepath = path(filename)
+    table = read_excel_table(filepath, **reader_kwargs)
+    assert isinstance(table, pa.Table)
+    df = read_excel(filepath, **reader_kwargs).reset_index(drop=True)
+    pd.testing.assert_frame_equal(table.to_pandas(), df)
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from peakina import DataSource
+from peakina.readers import read_parquet_table
 
 
 def test_simple_parquet_preview(path):
@@ -34,3 +35,9 @@ def test_simple_parquet_preview(path):
         reader_kwargs={"preview_offset": 2, "columns": ["Date", "Country"]},
     )
     assert ds.get_df().shape == (4898, 2)
+
+
+def test_read_parquet_table(path):
+    """It should read parquet files as Arrow tables"""
+    table = read_parquet_table(path("fixture.parquet"), preview_nrows=2, columns=["Date"])
+    assert table.to_pydict() == {"Date": ["29/01/1900", "31/07/1900"]}
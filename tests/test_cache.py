@@ -1,12 +1,35 @@
+import os
+import pickle
+import sqlite3
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import suppress
 from datetime import timedelta
+from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
 
-from peakina.cache import Cache, CacheEnum, InMemoryCache, PickleCache
+from peakina.cache import (
+    ArrowCache,
+    ArrowFormatEnum,
+    Cache,
+    CacheEnum,
+    CacheEvent,
+    CacheEventEnum,
+    CompressionEnum,
+    EvictionPolicyEnum,
+    InMemoryCache,
+    MetadataStore,
+    PickleCache,
+    SharedMemoryCache,
+    SingleFlight,
+    TieredCache,
+)
 
 
 @pytest.fixture
@@ -31,6 +54,100 @@ def test_inmemory_cache(df_test):
         c1.get("key")
 
 
+def test_inmemory_cache_lru_eviction():
+    """it should evict the least recently used entries when the cache is full"""
+    dfs = {key: pd.DataFrame({"x": range(100)}) for key in "abc"}
+    size = int(dfs["a"].memory_usage(index=True, deep=True).sum())
+    cache = InMemoryCache(max_bytes=2 * size)
+
+    cache.set("a", dfs["a"])
+    cache.set("b", dfs["b"])
+    cache.get("a")
+    cache.set("c", dfs["c"])  # "b" is the least recently used one
+    assert cache.size == 2 * size
+    assert_frame_equal(cache.get("a"), dfs["a"])
+    assert_frame_equal(cache.get("c"), dfs["c"])
+    with pytest.raises(KeyError):
+        cache.get("b")
+
+    # too big to be cached
+    cache.set("big", pd.DataFrame({"x": range(1000)}))
+    with pytest.raises(KeyError):
+        cache.get("big")
+    assert cache.size == 2 * size
+
+
+def test_inmemory_cache_greedy_dual_eviction():
+    """it should evict the cheapest entries to reload first"""
+    small_df = pd.DataFrame({"x": range(10)})
+    big_df = pd.DataFrame({"x": range(1000)})
+    max_bytes = int(big_df.memory_usage(index=True, deep=True).sum()) + 100
+    cache = InMemoryCache(max_bytes=max_bytes, policy=EvictionPolicyEnum.GREEDY_DUAL)
+
+    cache.set("small", small_df, cost=10)
+    # with LRU, "small" would have been evicted to make room for "big"
+    cache.set("big", big_df, cost=0.1)
+    cache.set("other_small", small_df, cost=1)
+    assert_frame_equal(cache.get("small"), small_df)
+    assert_frame_equal(cache.get("other_small"), small_df)
+    with pytest.raises(KeyError):
+        cache.get("big")
+
+
+@pytest.mark.parametrize("compression", [None, *CompressionEnum])
+def test_inmemory_cache_snapshot(tmp_path, df_test, compression):
+    """it should restore the snapshot of an in-memory cache, with the entries metadata"""
+    cache = InMemoryCache(compression=compression)
+    cache.set("a", df_test, mtime=10, cost=2.0)
+    cache.set("b", pd.DataFrame({"x": [0, "a", {"b": 1}]}), mtime=20)
+    cache.get("a")  # "b" is the least recently used entry
+    cache.snapshot(tmp_path)
+    cache.delete("a")
+    cache.snapshot(tmp_path)  # the files of the previous snapshot are replaced
+    cache.set("a", df_test, mtime=10, cost=2.0)
+    cache.snapshot(tmp_path)
+    assert len(list(tmp_path.iterdir())) == 3
+
+    restored = InMemoryCache(compression=compression)
+    restored.restore(tmp_path)
+    assert list(restored._cache) == ["b", "a"]
+    assert_frame_equal(restored.get("a", mtime=10), df_test)
+    assert restored.get_infos("a") == cache.get_infos("a")
+    assert_frame_equal(restored.get("b", mtime=20), cache.get("b"))
+    with pytest.raises(KeyError):
+        restored.get("a", mtime=11)
+
+    # missing strings keep their kind
+    df = pd.DataFrame({"x": ["a", np.nan, "c"], "y": ["a", None, "c"]})
+    cache.set("c", df)
+    cache.set("d", pd.DataFrame({"x": ["a", pd.NA]}))
+    cache.snapshot(tmp_path)
+    restored = InMemoryCache(compression=compression)
+    restored.restore(tmp_path)
+    assert isinstance(restored.get("c")["x"][1], float)
+    assert restored.get("c")["y"][1] is None
+    assert restored.get("d")["x"][1] is pd.NA
+
+
+@pytest.mark.parametrize("copy_on_write", [False, True])
+def test_inmemory_cache_copies(df_test, copy_on_write):
+    """it should protect the cached dataframes from modifications"""
+    expected = df_test.copy()
+    cache = InMemoryCache()
+    with pd.option_context("mode.copy_on_write", copy_on_write):
+        cache.set("key", df_test)
+        df_test.loc[0, "x"] = 10  # the given dataframe is left writable
+        df_test.loc[0, "y"] = "z"
+        df = cache.get("key")
+        assert df is not cache.get("key")
+        df.loc[1, "x"] = 10
+        df.loc[1, "y"] = "z"
+        df["z"] = 1
+        df = cache.get("key", columns=["y"])
+        df.loc[2, "y"] = "z"
+    assert_frame_equal(cache.get("key"), expected)
+
+
 def test_pickle_cache(mocker, tmp_path, df_test):
     """two pickle caches pointing to the same directory are equivalent"""
     c1 = Cache.get_cache(CacheEnum.PICKLE, cache_dir=tmp_path)
@@ -39,7 +156,7 @@ def test_pickle_cache(mocker, tmp_path, df_test):
     assert isinstance(c2, PickleCache)
 
     c1.set("key", df_test)
-    assert c1.get_metadata().shape == (1, 3)
+    assert c1.get_metadata().shape == (1, 7)
     assert_frame_equal(c1.get("key"), df_test)
     assert_frame_equal(c2.get("key"), df_test)
     assert_frame_equal(c2.get_metadata(), c1.get_metadata())
@@ -55,17 +172,303 @@ def test_pickle_cache(mocker, tmp_path, df_test):
     assert len(c1.get_metadata()) == 0
 
 
+@pytest.mark.parametrize("compression", list(CompressionEnum))
+def test_compressed_caches(tmp_path, compression):
+    """it should compress the entries with the chosen codec"""
+    df = pd.DataFrame({"x": [f"some repetitive content {i}" for i in range(1000)]})
+
+    memory_cache = InMemoryCache(compression=compression)
+    memory_cache.set("key", df)
+    assert memory_cache.size < df.memory_usage(index=True, deep=True).sum() / 2
+    assert_frame_equal(memory_cache.get("key"), df)
+    assert_frame_equal(memory_cache.get("key", columns=["x"]), df)
+
+    pickle_cache = PickleCache(tmp_path / "pickle", compression=compression)
+    pickle_cache.set("key", df)
+    assert (tmp_path / "pickle" / "key").stat().st_size < len(pickle.dumps(df)) / 2
+    assert pickle_cache.get_metadata()["codec"].tolist() == [compression.value]
+    assert_frame_equal(pickle_cache.get("key"), df)
+    # entries are readable whatever the codec of the cache
+    assert_frame_equal(PickleCache(tmp_path / "pickle").get("key"), df)
+
+    arrow_cache = ArrowCache(tmp_path / "arrow", compression=compression)
+    arrow_cache.set("key", df)
+    arrow_cache.set("mixed", pd.DataFrame({"x": [0, "a"]}))
+    assert_frame_equal(arrow_cache.get("key"), df)
+    assert arrow_cache.get("mixed")["x"].tolist() == [0, "a"]
+
+
+def test_pickle_cache_corrupted_metadata(tmp_path, df_test):
+    """it should recreate the metadata database if it's corrupted"""
+    (tmp_path / "__meta__.sqlite").write_bytes(b"not a sqlite database")
+    cache = PickleCache(tmp_path)
+    assert len(cache.get_metadata()) == 0
+    cache.set("key", df_test)
+    assert_frame_equal(cache.get("key"), df_test)
+
+
+def test_pickle_cache_locked_metadata(tmp_path, df_test, mocker):
+    """it should not remove the metadata database if it can't be opened for another reason"""
+    PickleCache(tmp_path).set("key", df_test)
+    mocker.patch.object(
+        MetadataStore, "_init_db", side_effect=sqlite3.OperationalError("database is locked")
+    )
+    with pytest.raises(sqlite3.OperationalError):
+        PickleCache(tmp_path)
+    mocker.stopall()
+    assert_frame_equal(PickleCache(tmp_path).get("key"), df_test)
+
+
+def _set_in_pickle_cache(cache_dir: Path, key: str) -> None:
+    PickleCache(cache_dir).set(key, pd.DataFrame({"key": [key]}))
+
+
+def test_pickle_cache_concurrent_writers(tmp_path):
+    """several processes can write in the same cache directory at the same time"""
+    keys = [f"key_{i}" for i in range(20)]
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_set_in_pickle_cache, [tmp_path] * len(keys), keys))
+
+    cache = PickleCache(tmp_path)
+    assert sorted(cache.get_metadata()["key"]) == sorted(keys)
+    for key in keys:
+        assert cache.get(key)["key"][0] == key
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+@pytest.mark.parametrize("format", list(ArrowFormatEnum))
+def test_arrow_cache(tmp_path, df_test, format):
+    """it should persist values as arrow files and read only the requested columns"""
+    c1 = Cache.get_cache(CacheEnum.ARROW, cache_dir=tmp_path, format=format)
+    c2 = Cache.get_cache(CacheEnum.ARROW, cache_dir=tmp_path, format=format)
+    assert isinstance(c1, ArrowCache)
+
+    c1.set("key", df_test)
+    assert (tmp_path / "key").read_bytes()[:4] in (b"ARRO", b"PAR1")
+    assert_frame_equal(c2.get("key"), df_test)
+    assert_frame_equal(c2.get("key", columns=["y"]), df_test[["y"]])
+
+    c1.delete("key")
+    with pytest.raises(KeyError):
+        c2.get("key")
+
+
+@pytest.mark.parametrize("format", list(ArrowFormatEnum))
+def test_arrow_cache_writable(tmp_path, format):
+    """it should return dataframes which can be modified without modifying the cached ones"""
+    cache = Cache.get_cache(CacheEnum.ARROW, cache_dir=tmp_path, format=format)
+    cache.set("key", pd.DataFrame({"a": [1, 2], "b": [1.5, 2.5]}))
+    for df in (cache.get("key"), cache.get("key", columns=["a"])):
+        df.loc[0, "a"] = 10
+    assert cache.get("key")["a"].tolist() == [1, 2]
+
+
+@pytest.mark.parametrize("format", list(ArrowFormatEnum))
+def test_arrow_cache_missing_strings(tmp_path, format):
+    """it should keep the kind of the missing strings"""
+    df = pd.DataFrame({"x": ["a", np.nan], "y": ["b", None], "z": [np.nan, "c"]})
+    cache = Cache.get_cache(CacheEnum.ARROW, cache_dir=tmp_path, format=format)
+    cache.set("key", df)
+    assert (tmp_path / "key").read_bytes()[:4] in (b"ARRO", b"PAR1")
+    df_cached = cache.get("key")
+    assert isinstance(df_cached["x"][1], float)
+    assert df_cached["y"][1] is None
+    assert isinstance(df_cached["z"][0], float)
+    assert isinstance(cache.get("key", columns=["x"])["x"][1], float)
+
+    # other missing values are pickled
+    df = pd.DataFrame({"x": ["a", pd.NA]})
+    cache.set("key", df)
+    assert (tmp_path / "key").read_bytes()[:4] not in (b"ARRO", b"PAR1")
+    assert cache.get("key")["x"][1] is pd.NA
+
+
+def test_arrow_cache_fallback(tmp_path):
+    """it should pickle the values that can't be converted to arrow"""
+    df = pd.DataFrame({"x": [0, "a", {"b": 1}]})
+    cache = Cache.get_cache(CacheEnum.ARROW, cache_dir=tmp_path)
+    cache.set("key", df)
+    assert_frame_equal(cache.get("key"), df)
+
+
+def test_pickle_cache_touch(tmp_path, mocker):
+    """it should only record every access with a budget, to spare the writer lock"""
+    df = pd.DataFrame({"x": range(10)})
+    touch_spy = mocker.spy(MetadataStore, "touch")
+    cache = PickleCache(tmp_path)
+    cache.set("a", df)
+    cache.get("a")
+    touch_spy.assert_not_called()
+    mocker.patch("peakina.cache.time", return_value=time.time() + 60)
+    cache.get("a")
+    cache.get("a")
+    assert touch_spy.call_count == 1
+
+    cache = PickleCache(tmp_path, max_bytes=10**9)
+    cache.get("a")
+    assert touch_spy.call_count == 2
+
+
+def test_pickle_cache_max_bytes(tmp_path, mocker):
+    """it should evict the least recently used files when the cache directory is full"""
+    df = pd.DataFrame({"x": range(1000)})
+    cache = PickleCache(tmp_path)
+    cache.set("a", df)
+    size = cache.get_infos("a")["size"]
+    cache = PickleCache(tmp_path, max_bytes=2 * size)
+
+    mock_time = mocker.patch("peakina.cache.time")
+    mock_time.return_value = time.time() + 1
+    cache.set("b", df)
+    mock_time.return_value += 1
+    cache.get("a")
+    mock_time.return_value += 1
+    cache.set("c", df)
+    assert sorted(cache.get_metadata()["key"]) == ["a", "c"]
+    assert sorted(p.name for p in tmp_path.iterdir() if not p.name.startswith("__")) == ["a", "c"]
+
+    # many entries evicted at once, from the least recently used one
+    cache.max_bytes = None
+    for i in range(40):
+        mock_time.return_value += 1
+        cache.set(f"key_{i:02}", df)
+    cache.max_bytes = 3 * size
+    mock_time.return_value += 1
+    cache.set("d", df)
+    assert sorted(cache.get_metadata()["key"]) == ["d", "key_38", "key_39"]
+
+
+def test_pickle_cache_gc(tmp_path, mocker, df_test):
+    """it should reconcile the metadata with the files on disk"""
+    cache = PickleCache(tmp_path)
+    for key in ("a", "b", "c"):
+        cache.set(key, df_test)
+    (tmp_path / "a").unlink()  # missing file
+    (tmp_path / "orphan").write_bytes(b"lost")  # file without metadata
+    (tmp_path / ".d.123.tmp").write_bytes(b"being written")
+    old_tmp_path = tmp_path / ".e.456.tmp"
+    old_tmp_path.write_bytes(b"failed write")
+    os.utime(old_tmp_path, (time.time() - 7200, time.time() - 7200))
+
+    cache.gc()
+    assert sorted(cache.get_metadata()["key"]) == ["b", "c"]
+    assert sorted(p.name for p in tmp_path.iterdir() if not p.name.startswith("__")) == [
+        ".d.123.tmp",
+        "b",
+        "c",
+    ]
+
+    # entries not used for a long time
+    mock_time = mocker.patch("peakina.cache.time")
+    mock_time.return_value = time.time() + 3600
+    cache.get("b")
+    mock_time.return_value += 1800
+    cache.gc(max_idle=timedelta(hours=1))
+    assert cache.get_metadata()["key"].tolist() == ["b"]
+    assert cache.stats().evictions == 1
+
+    cache.max_bytes = 1
+    cache.gc()
+    assert len(cache.get_metadata()) == 0
+    assert not (tmp_path / "b").exists()
+
+
+def _get_from_shared_memory_cache(shm_dir: Path, key: str) -> list[int]:
+    values: list[int] = SharedMemoryCache(shm_dir=shm_dir).get(key)["x"].tolist()
+    return values
+
+
+def test_shared_memory_cache(tmp_path, df_test):
+    """it should share memory-mapped entries between processes"""
+    cache = Cache.get_cache(CacheEnum.SHARED_MEMORY, shm_dir=tmp_path)
+    assert isinstance(cache, SharedMemoryCache)
+    assert cache.cache_dir == tmp_path / "peakina"
+    cache.set("key", df_test)
+    assert (tmp_path / "peakina" / "key").read_bytes()[:6] == b"ARROW1"
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert (
+            list(executor.map(_get_from_shared_memory_cache, [tmp_path] * 2, ["key"] * 2))
+            == [[0, 1, 2, 3]] * 2
+        )
+
+    df = cache.get("key")
+    cache.delete("key")
+    assert not (tmp_path / "peakina" / "key").exists()
+    assert_frame_equal(df, df_test)  # still mapped
+
+
+def test_shared_memory_cache_eviction(tmp_path, mocker):
+    """it should evict the least recently used entries, whichever process used them"""
+    df = pd.DataFrame({"x": range(1000)})
+    c1 = SharedMemoryCache(shm_dir=tmp_path)
+    c1.set("a", df)
+    size = c1.get_infos("a")["size"]
+    c1 = SharedMemoryCache(shm_dir=tmp_path, max_bytes=2 * size)
+    c2 = SharedMemoryCache(shm_dir=tmp_path, max_bytes=2 * size)
+
+    mock_time = mocker.patch("peakina.cache.time")
+    mock_time.return_value = time.time() + 1
+    c2.set("b", df)
+    mock_time.return_value += 1
+    c1.get("a")  # "b" is now the least recently used one
+    mock_time.return_value += 1
+    c2.set("c", df)
+    assert sorted(c1.get_metadata()["key"]) == ["a", "c"]
+    assert not (tmp_path / "peakina" / "b").exists()
+    assert c2.stats().evictions == 1
+
+    c2.set("big", pd.DataFrame({"x": range(10_000)}))  # too big: not cached
+    assert sorted(c1.get_metadata()["key"]) == ["a", "c"]
+
+
+def test_tiered_cache(mocker, tmp_path, df_test):
+    """it should look up in memory first, then on disk, and promote the disk hits in memory"""
+    c1 = Cache.get_cache(CacheEnum.TIERED, cache_dir=tmp_path)
+    assert isinstance(c1, TieredCache)
+    c1.set("key", df_test, mtime=10)
+    assert_frame_equal(c1.memory.get("key"), df_test)
+    assert_frame_equal(c1.persistent.get("key"), df_test)
+
+    # e.g. after a restart
+    c2 = TieredCache(tmp_path, persistent=CacheEnum.PICKLE)
+    with pytest.raises(KeyError):
+        c2.memory.get("key")
+    df = c2.get("key", mtime=10)
+    df.loc[0, "y"] = "z"  # the promoted value is not modified
+    persistent_get = mocker.spy(c2.persistent, "get")
+    assert_frame_equal(c2.get("key", mtime=10), df_test)
+    persistent_get.assert_not_called()
+
+    # the promoted value keeps its creation date
+    mocker.patch("peakina.cache.time").return_value = time.time() + 3600
+    with pytest.raises(KeyError):
+        c2.get("key", expire=timedelta(minutes=30))
+    with pytest.raises(KeyError):
+        c1.persistent.get("key")
+
+    with pytest.raises(ValueError):
+        TieredCache(tmp_path, persistent=CacheEnum.MEMORY)
+
+
 @pytest.fixture
 def cache(request: Any, tmpdir: str) -> Cache:
     if request.param == "memory":
         return Cache.get_cache(CacheEnum.MEMORY)
     elif request.param == "hdf":
         return Cache.get_cache(CacheEnum.PICKLE, cache_dir=tmpdir)
+    elif request.param == "arrow":
+        return Cache.get_cache(CacheEnum.ARROW, cache_dir=tmpdir)
+    elif request.param == "tiered":
+        return Cache.get_cache(CacheEnum.TIERED, cache_dir=tmpdir)
+    elif request.param == "shared_memory":
+        return Cache.get_cache(CacheEnum.SHARED_MEMORY, shm_dir=tmpdir)
     else:
         raise ValueError("invalid internal test config")
 
 
-cache_parametrize = pytest.mark.parametrize("cache", ["memory", "hdf"], indirect=True)
+cache_parametrize = pytest.mark.parametrize(
+    "cache", ["memory", "hdf", "arrow", "tiered", "shared_memory"], indirect=True
+)
 
 
 @cache_parametrize
@@ -84,3 +487,178 @@ def test_cache_expiration(cache, df_test, mocker):
     assert_frame_equal(cache.get("key", expire=timedelta(days=10)), df_test)
     with pytest.raises(KeyError):
         cache.get("key", expire=timedelta(days=8))
+
+
+@cache_parametrize
+def test_cache_get_infos(cache, df_test):
+    """it should give the metadata of a cached value"""
+    with pytest.raises(KeyError):
+        cache.get_infos("key")
+    cache.set("key", df_test, mtime=10, cost=2.0)
+    infos = cache.get_infos("key")
+    assert infos["mtime"] == 10
+    assert infos["cost"] == 2.0
+    assert infos["created_at"] <= time.time()
+
+
+@cache_parametrize
+def test_cache_stats(cache, df_test, mocker):
+    """it should count hits, misses, invalidations and stored bytes, globally and per key"""
+    events: list[CacheEvent] = []
+    cache.add_observer(events.append)
+
+    with pytest.raises(KeyError):
+        cache.get("key")
+    cache.set("key", df_test, mtime=10, cost=2.5)
+    cache.set("other_key", df_test, mtime=10)
+    cache.get("key", mtime=10)
+    cache.get("key", mtime=10)
+    with pytest.raises(KeyError):
+        cache.get("key", mtime=15)
+    mocker.patch("peakina.cache.time").return_value = time.time() + 3600
+    with pytest.raises(KeyError):
+        cache.get("other_key", expire=timedelta(minutes=1))
+
+    stats = cache.stats()
+    assert stats.hits == 2
+    assert stats.misses == 3
+    assert stats.hit_ratio == 2 / 5
+    assert stats.mtime_invalidations == 1
+    assert stats.expire_invalidations == 1
+    assert stats.load_time_saved == 5.0
+    assert stats.bytes_stored == 0
+
+    key_stats = cache.stats("key")
+    assert key_stats.hits == 2
+    assert key_stats.misses == 2
+    assert key_stats.expire_invalidations == 0
+    assert cache.stats("unknown") == type(stats)()
+
+    assert [e.kind for e in events if e.key == "key"] == [
+        CacheEventEnum.MISS,
+        CacheEventEnum.SET,
+        CacheEventEnum.HIT,
+        CacheEventEnum.HIT,
+        CacheEventEnum.INVALIDATION,
+        CacheEventEnum.MISS,
+    ]
+    set_event = next(e for e in events if e.kind is CacheEventEnum.SET)
+    assert set_event.nbytes > 0
+    cache.set("key", df_test)
+    last_set_event = [e for e in events if e.kind is CacheEventEnum.SET][-1]
+    assert cache.stats().bytes_stored == last_set_event.nbytes
+
+
+def test_cache_stats_evictions(df_test):
+    """it should count evictions and survive failing observers"""
+    size = int(df_test.memory_usage(index=True, deep=True).sum())
+    cache = InMemoryCache(max_bytes=size)
+
+    def failing_observer(event: CacheEvent) -> None:
+        raise ValueError("oops")
+
+    cache.add_observer(failing_observer)
+    cache.set("a", df_test)
+    cache.set("b", df_test)
+    assert cache.stats().evictions == 1
+    assert cache.stats("a").evictions == 1
+    assert cache.stats().bytes_stored == size
+
+
+def test_cache_stats_bounded(mocker, df_test):
+    """it should only keep the stats of the last keys without cached value"""
+    mocker.patch("peakina.cache._MAX_UNSTORED_KEYS_STATS", 2)
+    cache = InMemoryCache()
+    cache.set("stored", df_test)
+    for key in ("a", "b", "c"):
+        with pytest.raises(KeyError):
+            cache.get(key)
+    assert set(cache._keys_stats) == {"stored", "b", "c"}
+    assert cache.stats().misses == 3
+
+    cache.set_checked_mtime("stored", 10)
+    cache.delete("stored")
+    assert set(cache._keys_stats) == {"c", "stored"}
+    with pytest.raises(KeyError):
+        cache.get_checked_mtime("stored", timedelta(minutes=1))
+
+
+def test_single_flight():
+    """concurrent loads of the same key should only be done once"""
+    single_flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return len(calls)
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        leader = executor.submit(single_flight.do, "key", load)
+        started.wait()
+        followers = [executor.submit(single_flight.do, "key", load) for _ in range(3)]
+        other = executor.submit(single_flight.do, "other", lambda: "other")
+        assert other.result() == "other"
+        while not all(f.running() for f in followers):
+            time.sleep(0.01)
+        time.sleep(0.1)  # let the followers wait for the leader
+        release.set()
+        assert [f.result() for f in (leader, *followers)] == [1, 1, 1, 1]
+    assert single_flight.do("key", load) == 2  # not running anymore: loaded again
+
+
+def test_single_flight_copy():
+    """callers waiting for a load should get copies of its result if asked to"""
+    single_flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def load():
+        started.set()
+        release.wait()
+        return [1]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(single_flight.do, "key", load, copy=list)
+        started.wait()
+        follower = executor.submit(single_flight.do, "key", load, copy=list)
+        while not follower.running():
+            time.sleep(0.01)
+        time.sleep(0.1)  # let the follower wait for the leader
+        release.set()
+        assert leader.result() == follower.result() == [1]
+        assert leader.result() is not follower.result()
+
+
+def test_single_flight_exception():
+    """callers waiting for a failing load should get its exception"""
+    single_flight = SingleFlight()
+
+    def load():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        single_flight.do("key", load)
+    assert single_flight.do("key", lambda: 1) == 1
+
+
+def test_inmemory_cache_threads():
+    """concurrent accesses to an in-memory cache should keep it consistent"""
+    df = pd.DataFrame({"x": range(100)})
+    size = int(df.memory_usage(index=True, deep=True).sum())
+    cache = InMemoryCache(max_bytes=10 * size)
+
+    def work(i):
+        for j in range(50):
+            key = f"key_{(i + j) % 20}"
+            cache.set(key, df)
+            with suppress(KeyError):
+                cache.get(key)
+            if j % 7 == 0:
+                cache.delete(key)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(work, range(8)))
+    assert cache.size == size * len(cache._cache) <= 10 * size
+    assert cache.stats().bytes_stored == cache.size
@@ -1,10 +1,13 @@
+import asyncio
 import json
 from contextlib import suppress
 from typing import Any
 
 import pytest
 
+from peakina.cache import InMemoryCache
 from peakina.datapool import DataPool
+from peakina.datasource import DataSource
 
 
 def templatize(d: dict[str, Any], real_ftp_path: str) -> dict[str, Any]:
@@ -33,3 +36,17 @@ def test_datapool(config, path):
     assert "0_0" in pool
     df = pool["0_0"]
     assert df.shape == (2, 2)
+
+
+def test_datapool_metadata(path, mocker):
+    pool = DataPool({"0_0": {"uri": "0_0.csv"}}, path(""), cache=InMemoryCache())
+    read_metadata = mocker.spy(DataSource, "_read_metadata")
+    assert pool.get_metadata("0_0")["total_rows"] == 2
+    assert pool.get_metadata("0_0")["total_rows"] == 2
+    assert read_metadata.call_count == 1
+
+
+def test_datapool_aget(path):
+    pool = DataPool({"0_0": {"uri": "0_0.csv"}}, path(""))
+    df = asyncio.run(pool.aget("0_0"))
+    assert df.equals(pool["0_0"])
@@ -1,14 +1,23 @@
+import asyncio
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from datetime import timedelta
+from typing import Any, AsyncIterator
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 from pandas._testing.asserters import assert_frame_equal
 
-from peakina.cache import InMemoryCache
-from peakina.datasource import DataSource, read_pandas
-from peakina.helpers import TypeEnum
+import peakina.helpers
+from peakina.cache import Cache, CacheEnum, InMemoryCache
+from peakina.datasource import DataSource, read_arrow, read_pandas
+from peakina.executors import get_process_pool
+from peakina.helpers import TypeEnum, pd_read
 from peakina.io import MatchEnum
 
 
@@ -357,3 +366,530 @@ def test_cache(path, mocker):
     # fake a file with a different mtime (e.g: a new file has been uploaded):
     mocker.patch("peakina.io.local.file_fetcher.os.path.getmtime").return_value = mtime - 1
     assert ds.get_df(cache=cache).shape == (2, 2)  # cache has been invalidated
+
+
+@pytest.mark.parametrize(
+    "cache_kind,cache_kwargs",
+    [
+        (CacheEnum.MEMORY, {}),
+        (CacheEnum.ARROW, {"cache_dir": "arrow"}),
+        (CacheEnum.SHARED_MEMORY, {"shm_dir": "shm"}),
+    ],
+)
+def test_cache_writable(path, tmp_path, cache_kind, cache_kwargs):
+    """It should return dataframes which can be modified, whatever the cache"""
+    ds = DataSource(path("0_0.csv"), expire=timedelta(seconds=10))
+    cache = Cache.get_cache(cache_kind, **{k: tmp_path / v for k, v in cache_kwargs.items()})
+
+    expected = ds.get_df(cache=cache)
+    for _ in range(2):  # read from disk then retrieved from cache
+        df = next(ds.get_dfs(cache=cache))
+        df.loc[0, "a"] = 10
+    assert_frame_equal(ds.get_df(cache=cache), expected)
+
+
+def test_cache_chunks(path, read_csv_spy):
+    """It should cache the chunks one by one and replay them from the cache"""
+    ds = DataSource(path("0_*.csv"), match=MatchEnum.GLOB, reader_kwargs={"chunksize": 1})
+    ds.expire = timedelta(seconds=10)
+    cache = InMemoryCache()
+
+    expected = ds.get_df()
+    nb_reads = read_csv_spy.call_count  # read from disk, without cache
+    assert_frame_equal(ds.get_df(cache=cache), expected)
+    assert read_csv_spy.call_count == 2 * nb_reads  # read from disk, chunks are cached
+    dfs = list(ds.get_dfs(cache=cache))
+    assert read_csv_spy.call_count == 2 * nb_reads  # retrieved from cache
+    assert all(df.shape == (1, 3) for df in dfs)
+    assert_frame_equal(pd.concat(dfs).reset_index(drop=True), expected)
+
+    # a missing chunk: the remaining chunks of the file are read again
+    cache.delete(f"{next(ds.get_matched_datasources()).hash}_chunk_1")
+    dfs = list(ds.get_dfs(cache=cache))
+    assert_frame_equal(pd.concat(dfs).reset_index(drop=True), expected)
+    assert 2 * nb_reads < read_csv_spy.call_count < 3 * nb_reads  # only one file is read again
+
+
+def test_cache_chunks_partially_read(path):
+    """It should not replay a sequence of chunks which has not been entirely read"""
+    ds = DataSource(path("0_0.csv"), expire=timedelta(seconds=10), reader_kwargs={"chunksize": 1})
+    cache = InMemoryCache()
+    next(ds.get_dfs(cache=cache))
+    with pytest.raises(KeyError):
+        cache.get(ds.hash)
+    assert ds.get_df(cache=cache).shape == (2, 2)
+    assert cache.get(ds.hash)["nb_chunks"].iloc[0] == 2
+
+
+def _wait_for_refreshes() -> None:
+    for thread in threading.enumerate():
+        if thread.name.startswith("peakina-refresh"):
+            thread.join()
+
+
+def test_cache_stale_while_revalidate(path, mocker):
+    """It should return expired values while refreshing them in background"""
+    df = pd.DataFrame({"x": [1, 2, 3]})
+    ds = DataSource(path("0_0.csv"), expire=timedelta(seconds=10), max_stale=timedelta(seconds=10))
+    mtime = int(os.path.getmtime(path("0_0.csv")))
+    cache = InMemoryCache()
+    cache.set(ds.hash, value=df, mtime=mtime)
+    assert ds.hash == DataSource(path("0_0.csv")).hash
+
+    now = time.time()
+    mock_time = mocker.patch("peakina.cache.time")
+    mock_time.return_value = now + 15  # fake 15s elapsed: stale
+    assert ds.get_df(cache=cache).shape == (3, 1)  # stale value
+    _wait_for_refreshes()
+    assert cache.get(ds.hash).shape == (2, 2)  # refreshed in background
+    assert ds.get_df(cache=cache).shape == (2, 2)
+
+    mock_time.return_value = now
+    cache.set(ds.hash, value=df, mtime=mtime)
+    mock_time.return_value = now + 25  # fake 25s elapsed: too stale
+    assert ds.get_df(cache=cache).shape == (2, 2)  # blocking read
+
+    # values invalidated by their mtime are never returned
+    mock_time.return_value = now
+    cache.set(ds.hash, value=df, mtime=mtime - 1)
+    mock_time.return_value = now + 15
+    assert ds.get_df(cache=cache).shape == (2, 2)
+
+
+def test_cache_stale_while_revalidate_match(path, mocker):
+    """It should not cache the concatenated dataframe of stale values"""
+    ds = DataSource(
+        path("0_*"),
+        match=MatchEnum.GLOB,
+        expire=timedelta(seconds=10),
+        max_stale=timedelta(seconds=100),
+    )
+    cache = InMemoryCache()
+    now = time.time()
+    mock_time = mocker.patch("peakina.cache.time")
+    mock_time.return_value = now
+    expected = ds.get_df(cache=cache)
+    for datasource in ds.get_matched_datasources():
+        stale_df = cache.get(datasource.hash)
+        stale_df["a"] = 99
+        cache.set(datasource.hash, value=stale_df, mtime=cache.get_infos(datasource.hash)["mtime"])
+
+    mock_time.return_value = now + 15
+    assert (ds.get_df(cache=cache)["a"] == 99).all()  # stale values
+    _wait_for_refreshes()
+    assert_frame_equal(ds.get_df(cache=cache), expected)
+
+
+def test_cache_stale_while_revalidate_failure(path, mocker):
+    """It should keep the stale value if it cannot be refreshed"""
+    df = pd.DataFrame({"x": [1, 2, 3]})
+    ds = DataSource(path("0_0.csv"), expire=timedelta(seconds=10), max_stale=timedelta(seconds=10))
+    cache = InMemoryCache()
+    cache.set(ds.hash, value=df, mtime=int(os.path.getmtime(path("0_0.csv"))))
+    mocker.patch("peakina.cache.time").return_value = time.time() + 15
+    mocker.patch("peakina.datasource.pd_read", side_effect=ValueError("boom"))
+    assert ds.get_df(cache=cache).shape == (3, 1)
+    _wait_for_refreshes()
+    assert cache.get(ds.hash).shape == (3, 1)
+
+
+def test_cache_sliced_full_df(path, read_csv_spy):
+    """It should serve previews and sub-reads by slicing the cached full dataframe"""
+    cache = InMemoryCache()
+    expire = timedelta(seconds=10)
+    full_df = DataSource(path("fixture-1.csv"), expire=expire).get_df(cache=cache)
+    nb_reads = read_csv_spy.call_count
+
+    sliced_reads: list[tuple[dict[str, Any], pd.DataFrame]] = [
+        ({"preview_nrows": 2}, full_df.iloc[:2]),
+        ({"preview_offset": 3}, full_df.iloc[3:]),
+        ({"preview_offset": 1, "preview_nrows": 2}, full_df.iloc[1:3]),
+        ({"nrows": 3}, full_df.iloc[:3]),
+        ({"usecols": list(reversed(full_df.columns[:2]))}, full_df[full_df.columns[:2]]),
+    ]
+    for reader_kwargs, expected in sliced_reads:
+        ds = DataSource(path("fixture-1.csv"), expire=expire, reader_kwargs=reader_kwargs)
+        df = ds.get_df(cache=cache)
+        assert_frame_equal(df, expected.reset_index(drop=True))
+        assert_frame_equal(df, ds.get_df())  # same result as a read from disk
+    assert read_csv_spy.call_count == 6 * nb_reads  # only the reads without cache
+
+    # unknown columns or kwargs changing the slicing are read from disk
+    unsliceable_reader_kwargs: list[dict[str, Any]] = [
+        {"usecols": ["unknown"]},
+        {"usecols": [0]},
+        {"preview_nrows": 2, "skiprows": 1},
+        {"preview_nrows": 2, "nrows": 1},
+    ]
+    for reader_kwargs in unsliceable_reader_kwargs:
+        ds = DataSource(path("fixture-1.csv"), expire=expire, reader_kwargs=reader_kwargs)
+        call_count = read_csv_spy.call_count
+        with suppress(ValueError):
+            ds.get_df(cache=cache)
+        assert read_csv_spy.call_count > call_count
+
+
+def test_cache_single_flight(path, mocker):
+    """It should only load once a cold datasource asked by several threads at the same time"""
+    ds = DataSource(path("0_0.csv"), expire=timedelta(seconds=10))
+    cache = InMemoryCache()
+
+    def slow_pd_read(*args, **kwargs):
+        time.sleep(0.2)
+        return pd_read(*args, **kwargs)
+
+    pd_read_mock = mocker.patch("peakina.datasource.pd_read", side_effect=slow_pd_read)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        dfs = list(executor.map(lambda _: ds.get_df(cache=cache), range(4)))
+    assert pd_read_mock.call_count == 1
+    assert all(df.shape == (2, 2) for df in dfs)
+    # each caller gets its own dataframe
+    dfs[0].iloc[0, 0] = -1
+    assert all(df.iloc[0, 0] != -1 for df in [*dfs[1:], ds.get_df(cache=cache)])
+
+
+def test_cache_metadata(path, mocker):
+    """It should cache the metadata until the file changes"""
+    ds = DataSource(path("fixture-1.csv"))
+    cache = InMemoryCache()
+    open_spy = mocker.spy(ds.fetcher, "open")
+    meta = ds.get_metadata(cache=cache)
+    assert meta["total_rows"] > 0
+    assert open_spy.call_count == 1
+
+    ds = DataSource(path("fixture-1.csv"))
+    open_spy = mocker.spy(ds.fetcher, "open")
+    assert ds.get_metadata(cache=cache) == meta
+    assert open_spy.call_count == 0
+    assert "encoding" in ds.reader_kwargs  # the detected encoding is restored
+
+    ds = DataSource(path("fixture-1.csv"))
+    open_spy = mocker.spy(ds.fetcher, "open")
+    mtime = os.path.getmtime(path("fixture-1.csv"))
+    mocker.patch("peakina.io.local.file_fetcher.os.path.getmtime").return_value = mtime + 1
+    assert ds.get_metadata(cache=cache) == meta
+    assert open_spy.call_count == 1  # cache has been invalidated
+
+
+def test_cache_revalidate_after(path, mocker):
+    """It should not check the mtime of a cached datasource again during `revalidate_after`"""
+    ds = DataSource(
+        path("0_0.csv"), expire=timedelta(hours=1), revalidate_after=timedelta(seconds=10)
+    )
+    assert ds.hash == DataSource(path("0_0.csv")).hash
+    cache = InMemoryCache()
+    mtime_spy = mocker.spy(ds.fetcher, "mtime")
+    df = ds.get_df(cache=cache)
+    assert ds.get_df(cache=cache).equals(df)
+    assert mtime_spy.call_count == 1
+
+    # the file changes but its mtime is not checked yet
+    mtime = os.path.getmtime(path("0_0.csv"))
+    mocker.patch("peakina.io.local.file_fetcher.os.path.getmtime").return_value = mtime + 1
+    cache.set(ds.hash, value=pd.DataFrame({"x": [1]}), mtime=mtime)
+    assert ds.get_df(cache=cache).shape == (1, 1)
+    assert mtime_spy.call_count == 1
+
+    mocker.patch("peakina.cache.time").return_value = time.time() + 15
+    assert ds.get_df(cache=cache).shape == (2, 2)  # checked again: cache has been invalidated
+    assert mtime_spy.call_count == 2
+
+
+def test_cache_detected_kwargs(path, mocker):
+    """It should keep the detected encoding and separator in the cache"""
+    ds = DataSource(path("latin_1.csv"), expire=timedelta(seconds=10))
+    cache = InMemoryCache()
+    detect_kwargs = mocker.spy(DataSource, "_detect_kwargs")
+    df = ds.get_df(cache=cache)
+    assert detect_kwargs.call_count == 1
+    assert detect_kwargs.spy_return["encoding"] is not None
+
+    cache.delete(ds.hash)  # e.g. evicted
+    assert_frame_equal(ds.get_df(cache=cache), df)
+    assert detect_kwargs.call_count == 1
+
+    # the file has changed
+    mtime = os.path.getmtime(path("latin_1.csv"))
+    mocker.patch("peakina.io.local.file_fetcher.os.path.getmtime").return_value = mtime + 1
+    assert_frame_equal(ds.get_df(cache=cache), df)
+    assert detect_kwargs.call_count == 2
+
+
+def test_cache_concatenated_df(path, mocker):
+    """It should cache the concatenated dataframe of a matched datasource"""
+    ds = DataSource(path("0_*.csv"), match=MatchEnum.GLOB, expire=timedelta(seconds=10))
+    cache = InMemoryCache()
+    df = ds.get_df(cache=cache)
+    assert df.shape == (6, 3)
+    concat_spy = mocker.spy(DataSource, "_concat")
+    assert_frame_equal(ds.get_df(cache=cache), df)
+    concat_spy.assert_not_called()
+
+    fingerprint = cache.get_infos(f"{ds.hash}__concat")["mtime"]
+    cache.set(f"{ds.hash}__concat", pd.DataFrame({"x": [1]}), mtime=fingerprint)
+    assert ds.get_df(cache=cache).shape == (1, 1)
+
+    # a matched file has changed
+    mtime = os.path.getmtime(path("0_0.csv"))
+    mocker.patch("peakina.io.local.file_fetcher.os.path.getmtime").return_value = mtime + 1
+    assert_frame_equal(ds.get_df(cache=cache), df)
+    assert concat_spy.call_count == 1
+
+
+def test_hash():
+    """It should give the same key to datasources reading the same data"""
+    ds = DataSource("file.csv", reader_kwargs={"sep": ";", "dtype": {"b": "str", "a": "int"}})
+    assert ds.hash.startswith("_file_csv_")
+    same_datasources = [
+        DataSource("file.csv", reader_kwargs={"dtype": {"a": "int", "b": "str"}, "sep": ";"}),
+        DataSource(
+            "file.csv",
+            expire=timedelta(seconds=10),
+            reader_kwargs={"sep": ";", "dtype": {"b": "str", "a": "int"}, "on_bad_lines": "skip"},
+        ),
+        DataSource("file.csv", reader_kwargs={"sep": ";", "dtype": {"b": "str", "a": "int"}}),
+    ]
+    same_datasources[-1].reader_kwargs["encoding"] = "utf-8"
+    same_datasources[-1]._detected_kwargs.add("encoding")
+    assert all(other.hash == ds.hash for other in same_datasources)
+
+    other_datasources = [
+        DataSource("file.csv", reader_kwargs={"sep": ","}),
+        DataSource("file.csv", reader_kwargs={"sep": ";", "dtype": {"b": "str", "a": "str"}}),
+        DataSource("file.csv", reader_kwargs={"sep": ";", "on_bad_lines": "error"}),
+        DataSource("other.csv", reader_kwargs={"sep": ";", "dtype": {"b": "str", "a": "int"}}),
+    ]
+    assert len({other.hash for other in other_datasources} | {ds.hash}) == 5
+
+    # keys of different types
+    ds = DataSource("file.csv", reader_kwargs={"dtype": {"a": str, 1: str}})
+    assert ds.hash == DataSource("file.csv", reader_kwargs={"dtype": {1: str, "a": str}}).hash
+
+    # the memoized hash follows the changes of the datasource
+    hash_ = ds.hash
+    ds.reader_kwargs["sep"] = ";"
+    assert ds.hash != hash_
+    del ds.reader_kwargs["sep"]
+    assert ds.hash == hash_
+    ds.uri = "other.csv"
+    assert ds.hash.startswith("_other_csv_")
+
+
+def test_match_max_workers(path, mocker):
+    """It should fetch and read matched files concurrently, keeping their order"""
+    ds = DataSource(path("0_*"), match=MatchEnum.GLOB)
+    expected = ds.get_df()
+
+    open_ = ds.fetcher.open
+    threads = set()
+
+    def slow_open(filepath):
+        threads.add(threading.current_thread().name)
+        time.sleep(0.05 if filepath.endswith("0_0.csv") else 0)  # the first file is the slowest
+        return open_(filepath)
+
+    parallel_ds = DataSource(path("0_*"), match=MatchEnum.GLOB, max_workers=4)
+    assert parallel_ds.hash == ds.hash
+    mocker.patch.object(parallel_ds.fetcher, "open", side_effect=slow_open)
+    assert_frame_equal(parallel_ds.get_df(), expected)
+    assert len(threads) > 1
+
+    cache = InMemoryCache()
+    parallel_ds.expire = timedelta(seconds=10)
+    assert_frame_equal(parallel_ds.get_df(cache=cache), expected)
+    assert_frame_equal(parallel_ds.get_df(cache=cache), expected)
+
+    assert_frame_equal(read_pandas(path("0_*"), match=MatchEnum.GLOB, max_workers=2), expected)
+
+
+@pytest.mark.parametrize(
+    "filename,reader_kwargs",
+    [
+        ("fixture.xml", {}),
+        ("fixture.xml", {"filter": '.records .record[] | .["@id"]|=tonumber'}),
+        ("fixture.json", {"filter": '.records .record[] | .["@id"]|=tonumber', "lines": True}),
+        ("fixture.parquet", {}),
+        ("latin_1_sep.csv", {"engine": "python"}),
+        ("empty.csv", {}),
+        ("sample.geojson", {}),
+    ],
+)
+def test_parse_in_processes(path, filename, reader_kwargs):
+    """It should parse files in worker processes and get the same dataframes"""
+    ds = DataSource(path(filename), reader_kwargs=reader_kwargs)
+    in_process_ds = DataSource(path(filename), reader_kwargs=reader_kwargs, parse_in_processes=True)
+    assert in_process_ds.hash == ds.hash
+    expected = ds.get_df()
+    df = in_process_ds.get_df()
+    assert type(df) is type(expected)
+    assert_frame_equal(df, expected)
+
+
+def test_parse_in_processes_missing_values(tmp_path, mocker):
+    """It should keep the missing strings as NaN and parse unpicklable kwargs in the process"""
+    filepath = tmp_path / "missing.csv"
+    filepath.write_text("a,b\n1,x\n2,\n")
+    df = DataSource(str(filepath), parse_in_processes=True).get_df()
+    assert isinstance(df["b"][1], float)  # NaN as with pd.read_csv, not None
+
+    submit_spy = mocker.spy(get_process_pool(), "submit")
+    ds = DataSource(
+        str(filepath),
+        reader_kwargs={"converters": {"a": lambda v: int(v) * 2}},
+        parse_in_processes=True,
+    )
+    assert ds.get_df()["a"].tolist() == [2, 4]
+    submit_spy.assert_not_called()
+
+
+def test_parse_in_processes_match(path, mocker):
+    """It should parse matched files in worker processes, concurrently with `max_workers`"""
+    expected = read_pandas(path("0_*"), match=MatchEnum.GLOB)
+    submit_spy = mocker.spy(get_process_pool(), "submit")
+    df = read_pandas(path("0_*"), match=MatchEnum.GLOB, max_workers=4, parse_in_processes=True)
+    assert_frame_equal(df, expected)
+    assert submit_spy.call_count == 4
+
+    # chunks are still parsed in the current process
+    submit_spy.reset_mock()
+    ds = DataSource(path("0_0.csv"), reader_kwargs={"chunksize": 1}, parse_in_processes=True)
+    assert len(list(ds.get_dfs())) == 2
+    submit_spy.assert_not_called()
+
+
+def test_aget_df(path, mocker):
+    """It should get the same dataframes without blocking the event loop"""
+    ds = DataSource(path("0_*"), match=MatchEnum.GLOB, max_workers=2)
+    expected = ds.get_df()
+    aopen_spy = mocker.spy(ds.fetcher, "aopen")
+    assert_frame_equal(asyncio.run(ds.aget_df()), expected)
+    assert aopen_spy.call_count == 4
+
+    ds = DataSource(path("0_0.csv"), reader_kwargs={"chunksize": 1})
+    dfs = asyncio.run(_collect(ds.aget_dfs()))
+    assert len(dfs) == 2
+
+    # with a cache
+    cache = InMemoryCache()
+    ds = DataSource(path("0_*"), match=MatchEnum.GLOB, expire=timedelta(seconds=10))
+    assert_frame_equal(asyncio.run(ds.aget_df(cache=cache)), expected)
+    aopen_spy = mocker.spy(ds.fetcher, "aopen")
+    assert_frame_equal(asyncio.run(ds.aget_df(cache=cache)), expected)
+    assert_frame_equal(asyncio.run(_collect(ds.aget_dfs(cache=cache)))[0], expected.iloc[:2])
+    aopen_spy.assert_not_called()
+
+
+async def _collect(dfs: AsyncIterator[pd.DataFrame]) -> list[pd.DataFrame]:
+    return [df async for df in dfs]
+
+
+@pytest.mark.parametrize("with_cache", [False, True])
+def test_aget_dfs_chunks(path, mocker, with_cache):
+    """It should yield the chunks as soon as they are parsed"""
+    events = []
+
+    def read_chunks(*args, **kwargs):
+        for i, chunk in enumerate(pd_read(*args, **kwargs)):
+            events.append(f"parsed {i}")
+            yield chunk
+
+    mocker.patch("peakina.datasource.pd_read", side_effect=read_chunks)
+    ds = DataSource(
+        path("0_0.csv"),
+        reader_kwargs={"chunksize": 1},
+        expire=timedelta(seconds=10) if with_cache else None,
+    )
+
+    async def consume() -> None:
+        async for _ in ds.aget_dfs(cache=InMemoryCache()):
+            events.append("yielded")
+
+    asyncio.run(consume())
+    assert events == ["parsed 0", "yielded", "parsed 1", "yielded"]
+
+
+def test_aget_df_single_flight(path, mocker):
+    """It should only load once a cold datasource asked by several coroutines at the same time"""
+    ds = DataSource(path("0_0.csv"), expire=timedelta(seconds=10))
+    cache = InMemoryCache()
+    aopen_spy = mocker.spy(ds.fetcher, "aopen")
+
+    async def load_concurrently() -> list[pd.DataFrame]:
+        return await asyncio.gather(*(ds.aget_df(cache=cache) for _ in range(10)))
+
+    dfs = asyncio.run(load_concurrently())
+    assert aopen_spy.call_count == 1
+    assert all(df.shape == (2, 2) for df in dfs)
+
+
+def test_concat(mocker):
+    """It should concatenate dataframes with the same columns as Arrow tables"""
+    parts = [
+        pd.DataFrame(
+            {
+                "a": [i, i + 1],
+                "b": ["x", np.nan if i else "y"],
+                "c": pd.to_datetime(["2020-01-01", "2020-01-02"]),
+                "d": [True, False],
+            },
+            index=[5, 6],
+        )
+        for i in range(3)
+    ]
+    expected = pd.concat(parts, sort=False).reset_index(drop=True)
+    concat_spy = mocker.spy(pd, "concat")
+    df = DataSource._concat(iter(parts))
+    concat_spy.assert_not_called()
+    assert_frame_equal(df, expected)
+    assert isinstance(df["b"].iloc[3], float)  # NaN as in the parts, not None
+    df.loc[0, "a"] = 10  # not read-only
+
+    # dataframes which can't be exactly concatenated as Arrow tables
+    for other_parts in (
+        [pd.DataFrame({"a": [1]}), pd.DataFrame({"a": [1.5]})],  # different dtypes
+        [pd.DataFrame({"a": [1]}), pd.DataFrame({"b": [1]})],  # different columns
+        [pd.DataFrame({"a": [{"x": 1}]}), pd.DataFrame({"a": [{"x": 2}]})],  # dicts
+        [pd.DataFrame({"a": ["x"]}), pd.DataFrame({"a": [1]}, dtype=object)],  # mixed types
+        [pd.DataFrame({"a": [1]}), pd.DataFrame({"a": [2]})][:1],  # a single dataframe
+    ):
+        assert_frame_equal(
+            DataSource._concat(other_parts),
+            pd.concat(other_parts, sort=False).reset_index(drop=True),
+        )
+
+
+def test_concat_zero_copy_columns(mocker):
+    """It should return writable dataframes even if Arrow doesn't copy the concatenated columns"""
+    concat_tables = pa.concat_tables
+    # columns made of a single chunk are converted to pandas without any copy
+    mocker.patch(
+        "peakina.datasource.pa.concat_tables",
+        side_effect=lambda tables: concat_tables(tables).combine_chunks(),
+    )
+    parts = [pd.DataFrame({"a": [i, i + 1], "b": [0.5, 1.5]}) for i in range(2)]
+    expected = pd.concat(parts).reset_index(drop=True)
+    df = DataSource._concat(iter(parts))
+    assert_frame_equal(df, expected)
+    df.loc[0, "a"] = 10  # not read-only
+
+
+def test_get_table(path, mocker):
+    """It should read datasources as Arrow tables, without pandas for the formats supporting it"""
+    pd_read_spy = mocker.spy(peakina.helpers, "pd_read")
+    for filename in ("fixture.parquet", "fixture-single-sheet.xlsx"):
+        table = DataSource(path(filename)).get_table()
+        assert isinstance(table, pa.Table)
+        pd_read_spy.assert_not_called()
+        assert_frame_equal(table.to_pandas(), DataSource(path(filename)).get_df())
+    DataSource(path("0_0.csv")).get_table()  # read with pandas
+    pd_read_spy.assert_called_once()
+
+    ds = DataSource(path("0_*"), match=MatchEnum.GLOB, max_workers=2)
+    table = ds.get_table()
+    assert table.column_names == ["a", "b", "__filename__"]
+    assert_frame_equal(table.to_pandas(), ds.get_df())
+    assert_frame_equal(read_arrow(path("0_*"), match=MatchEnum.GLOB).to_pandas(), ds.get_df())
+
+    tables = list(DataSource(path("0_0.csv"), reader_kwargs={"chunksize": 1}).get_tables())
+    assert [t.num_rows for t in tables] == [1, 1]
+    assert DataSource(path("empty.csv")).get_table().num_rows == 0
@@ -0,0 +1,57 @@
+import asyncio
+import threading
+import time
+from typing import Generator
+
+from peakina.executors import aiterate, map_ordered
+
+
+def test_map_ordered():
+    """It should yield the results in order, computing them concurrently"""
+    threads = set()
+
+    def f(x: int) -> int:
+        threads.add(threading.current_thread().name)
+        time.sleep(0.01 * (5 - x))  # the first items are the slowest
+        return x * 2
+
+    assert list(map_ordered(f, range(5), max_workers=5)) == [0, 2, 4, 6, 8]
+    assert len(threads) > 1
+    assert all(name.startswith("peakina-worker") for name in threads)
+
+
+def test_map_ordered_prefetch():
+    """It should only compute `prefetch` results ahead and cancel them when closed"""
+    calls: list[int] = []
+    results = map_ordered(calls.append, range(100), max_workers=2, prefetch=3)
+    next(results)
+    time.sleep(0.05)
+    assert len(calls) == 4
+    results.close()
+    assert len(calls) <= 5
+
+
+def test_aiterate():
+    """It should iterate in threads, closing the iterator when closed before its end"""
+    threads = set()
+    closed = []
+
+    def items() -> Generator[int, None, None]:
+        try:
+            for i in range(5):
+                threads.add(threading.current_thread())
+                yield i
+        finally:
+            closed.append(True)
+
+    async def first_items() -> list[int]:
+        results = []
+        async for item in aiterate(items()):
+            results.append(item)
+            if item == 2:
+                break
+        return results
+
+    assert asyncio.run(first_items()) == [0, 1, 2]
+    assert threading.main_thread() not in threads
+    assert closed == [True]